@@ -15,6 +15,7 @@ def main() -> int:
     parser.add_argument("--compress", action="store_true")
     parser.add_argument("--format", default="markdown", choices=[f.value for f in PackFormat])
     parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--extract-cache", type=Path, default=None, help="Persistent extraction cache directory")
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -44,6 +45,7 @@ def main() -> int:
         entries=[],
         deps=False,
         python_roots=[],
+        extract_cache_dir=args.extract_cache,
     )
     elapsed = time.perf_counter() - start
     tokens = sum(a.tokens for a in res.artifacts)
@@ -825,6 +825,14 @@ def pack(
             help="Python import root(s) for dependency resolution (default: ROOT/src if present, else ROOT).",
         ),
     ] = None,
+    extract_cache: Annotated[
+        Path | None,
+        typer.Option(
+            "--extract-cache",
+            help="Directory for a persistent Python extraction cache reused across runs "
+            "(--compress and hybrid summaries). Resolved relative to ROOT if not absolute.",
+        ),
+    ] = None,
 ) -> None:
     """Pack a repository into a single deterministic artifact.
 
@@ -926,6 +934,13 @@ def pack(
             pack_cfg.pyright_langserver_cmd if pyright_langserver_cmd is None else pyright_langserver_cmd
         )
         resolved_python_roots = [Path(p) for p in pack_cfg.python_roots] if python_root is None else python_root
+        resolved_extract_cache: Path | None
+        if extract_cache is not None:
+            resolved_extract_cache = (root / extract_cache).resolve()
+        elif pack_cfg.extract_cache is not None:
+            resolved_extract_cache = (root / pack_cfg.extract_cache).resolve()
+        else:
+            resolved_extract_cache = None
 
         selection_report_path: Path | None = None
         if explain_selection:
@@ -974,6 +989,7 @@ def pack(
             entries=entry,
             deps=resolved_deps,
             python_roots=resolved_python_roots,
+            extract_cache_dir=resolved_extract_cache,
         )
 
         for a in res.artifacts:
@@ -48,6 +48,7 @@ class PackConfig(BaseModel):
     meta: list[str] = Field(default_factory=list)
     summary_config: SummaryConfig = Field(default_factory=SummaryConfig)
     python_roots: list[str] = Field(default_factory=list)
+    extract_cache: str | None = None
     slice_backend: SliceBackend = SliceBackend.IMPORTS
     uses_include_private: bool = False
     pyright_langserver_cmd: str = "pyright-langserver --stdio"
@@ -255,6 +256,7 @@ class AnatomizeConfig(BaseModel):
                 "meta": self.pack.meta,
                 "summary_config": self.pack.summary_config.model_dump(mode="json"),
                 "python_roots": self.pack.python_roots,
+                "extract_cache": self.pack.extract_cache,
                 "slice_backend": self.pack.slice_backend.value,
                 "uses_include_private": self.pack.uses_include_private,
                 "pyright_langserver_cmd": self.pack.pyright_langserver_cmd,
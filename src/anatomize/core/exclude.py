@@ -12,16 +12,22 @@ Supported:
 - rules without `/` match against basenames (gitignore-like)
 - glob wildcards including `**`
 - trailing `/` marks directory-only rule
+
+Rules are compiled once into combined regular expressions (one for
+directories, one for files) so each path is matched in a single pass.
+Parsed lines and translated globs are memoized process-wide, since the same
+defaults and `.gitignore` lines recur across matchers and `pack` runs;
+`clear_glob_caches` drops them.
 """
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import re
 from collections.abc import Sequence
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
-from functools import cache
-from pathlib import PurePosixPath
-from typing import TypeAlias
+from typing import Protocol, TypeAlias
 
 
 @dataclass(frozen=True)
@@ -58,6 +64,9 @@ class ExcludeRule:
         True if pattern contains a path separator.
     source
         Where this rule came from (e.g., '.gitignore', 'cli').
+    display_pattern
+        The pattern as reported to users, with the trailing '/' restored for
+        directory-only rules.
     """
 
     pattern: str
@@ -66,11 +75,28 @@ class ExcludeRule:
     directory_only: bool
     has_slash: bool
     source: str
+    display_pattern: str
 
 
 IgnorePattern: TypeAlias = str | tuple[str, str]
 
 
+class PathRule(Protocol):
+    """Shape shared by compiled gitignore-style rules (see `rule_regex`)."""
+
+    @property
+    def pattern(self) -> str: ...
+
+    @property
+    def anchored(self) -> bool: ...
+
+    @property
+    def directory_only(self) -> bool: ...
+
+    @property
+    def has_slash(self) -> bool: ...
+
+
 class Excluder:
     """Gitignore-style path exclusion matcher.
 
@@ -123,9 +149,15 @@ class Excluder:
                     directory_only=directory_only,
                     has_slash=has_slash,
                     source=source,
+                    display_pattern=raw + "/" if directory_only else raw,
                 )
             )
 
+        # Alternatives are ordered last-rule-first so the first matching alternative is the winning rule.
+        ordered = list(reversed(self._rules))
+        self._dir_regex = compile_alternation([rule_regex(r, is_dir=True) for r in ordered])
+        self._file_regex = compile_alternation([rule_regex(r, is_dir=False) for r in ordered])
+
     def is_excluded(self, rel_posix: str, *, is_dir: bool) -> bool:
         """Return True if the given relative path should be excluded."""
         return self.explain(rel_posix, is_dir=is_dir)[0]
@@ -136,17 +168,14 @@ class Excluder:
 
     def explain(self, rel_posix: str, *, is_dir: bool) -> tuple[bool, ExcludeRule | None]:
         """Return (excluded, last_matching_rule_or_None)."""
-        rel_posix = rel_posix.strip("/")
-        path = PurePosixPath(rel_posix) if rel_posix else PurePosixPath(".")
-
-        excluded = False
-        matched: ExcludeRule | None = None
-        for rule in self._rules:
-            if not self._matches(path, rule, is_dir=is_dir):
-                continue
-            excluded = not rule.negated
-            matched = rule
-        return excluded, matched
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return False, None
+        m = regex.match(match_key(rel_posix))
+        if m is None or m.lastindex is None:
+            return False, None
+        rule = self._rules[len(self._rules) - m.lastindex]
+        return not rule.negated, rule
 
     def filter_dirnames(self, parent_rel_posix: str, dirnames: list[str]) -> None:
         """Prune excluded directories in-place for os.walk dirnames."""
@@ -159,67 +188,107 @@ class Excluder:
             keep.append(d)
         dirnames[:] = keep
 
-    def _matches(self, path: PurePosixPath, rule: ExcludeRule, *, is_dir: bool) -> bool:
-        # Directory-only rules match the directory and anything under it.
-        if rule.directory_only:
-            if is_dir and self._match_single(path, rule):
-                return True
-            for parent in path.parents:
-                if self._match_single(parent, rule):
-                    return True
-            return False
-
-        return self._match_single(path, rule)
 
-    def _match_single(self, path: PurePosixPath, rule: ExcludeRule) -> bool:
-        pattern = rule.pattern
+def match_key(rel_posix: str) -> str:
+    """Normalize a relative POSIX path into the string form matched by `rule_regex`.
 
-        path_parts = tuple(p for p in path.parts if p != ".")
-        pat_parts = tuple(part for part in pattern.split("/") if part)
+    Each path segment is followed by `/` (e.g. `a/b.py` -> `a/b.py/`), and the
+    root (`""` or `.`) maps to the empty string. `.` segments and empty segments
+    are dropped, mirroring `PurePosixPath` normalization.
+    """
+    return "".join(f"{part}/" for part in rel_posix.split("/") if part and part != ".")
 
-        if not rule.has_slash and not rule.anchored:
-            # Basename-style matching (gitignore-like): matches the last segment.
-            if not path_parts:
-                return False
-            return fnmatchcase(path_parts[-1], pattern)
 
-        if rule.anchored:
-            return _match_parts(pat_parts, path_parts)
+def rule_regex(rule: PathRule, *, is_dir: bool) -> str:
+    """Translate a parsed gitignore-style rule into a regex over `match_key` strings.
 
+    Parameters
+    ----------
+    rule
+        Parsed rule (pattern without anchoring or directory-only slashes).
+    is_dir
+        True to build the variant used for directory paths.
+
+    Returns
+    -------
+    str
+        Regex source to be applied with `re.match` (implicitly anchored at the start).
+    """
+    if not rule.has_slash and not rule.anchored:
+        # Basename-style matching (gitignore-like): matches the last segment.
+        body = f"(?:[^/]+/)*{_segment_regex(rule.pattern)}/"
+    else:
+        # `**` matches zero or more whole segments.
+        parts = [
+            "(?:[^/]+/)*" if part == "**" else f"{_segment_regex(part)}/" for part in rule.pattern.split("/") if part
+        ]
         # Pattern with slash and not anchored: match at any segment boundary.
-        for start in range(len(path_parts) + 1):
-            if _match_parts(pat_parts, path_parts[start:]):
-                return True
-        return False
-
-
-@cache
-def _match_parts(pat_parts: tuple[str, ...], path_parts: tuple[str, ...]) -> bool:
-    return _match_parts_at(pat_parts, 0, path_parts, 0)
+        body = ("" if rule.anchored else "(?:[^/]+/)*") + "".join(parts)
 
+    if not rule.directory_only:
+        return body + r"\Z"
+    # Directory-only rules match the directory and anything under it: any segment-aligned prefix of a
+    # directory path, or any proper prefix of a file path.
+    return body if is_dir else body + "(?=.)"
 
-@cache
-def _match_parts_at(pat_parts: tuple[str, ...], pi: int, path_parts: tuple[str, ...], si: int) -> bool:
-    if pi == len(pat_parts):
-        return si == len(path_parts)
 
-    pat = pat_parts[pi]
-    if pat == "**":
-        # Match zero or more segments.
-        for k in range(si, len(path_parts) + 1):
-            if _match_parts_at(pat_parts, pi + 1, path_parts, k):
-                return True
-        return False
-
-    if si == len(path_parts):
-        return False
-
-    if not fnmatchcase(path_parts[si], pat):
-        return False
-
-    return _match_parts_at(pat_parts, pi + 1, path_parts, si + 1)
+def compile_alternation(alternatives: list[str]) -> re.Pattern[str] | None:
+    """Combine rule regexes into one pattern; `match.lastindex - 1` is the matching alternative."""
+    if not alternatives:
+        return None
+    return re.compile("|".join(f"(?P<r{i}>{alt})" for i, alt in enumerate(alternatives)), re.DOTALL)
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile an `fnmatch`-style glob (as `re.compile(fnmatch.translate(pattern))`), memoized."""
+    return _compile_glob(pattern)
+
+
+def clear_glob_caches() -> None:
+    """Drop memoized ignore-line parses and glob translations (for long-running processes)."""
+    parse_ignore_line.cache_clear()
+    _compile_glob.cache_clear()
+    _segment_regex.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    return re.compile(fnmatch.translate(pattern))
+
+
+@functools.lru_cache(maxsize=4096)
+def _segment_regex(segment: str) -> str:
+    # Same glob dialect as `fnmatch.fnmatchcase`, but wildcards never cross a `/`.
+    out: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            if not out or out[-1] != "[^/]*":
+                out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                # Delegate bracket expressions to fnmatch (strip its trailing `\Z`).
+                out.append("(?!/)" + fnmatch.translate(segment[i - 1 : j + 1])[:-2])
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_ignore_line(raw: str, *, allow_negation: bool) -> ParsedIgnoreLine | None:
     r"""Parse a gitignore-like line with strict, minimal escaping support.
 
@@ -55,7 +55,15 @@ class SymbolExtractor:
         self._parser = PythonParser()
         self._resolution = resolution
 
-    def extract_module(self, path: Path, module_name: str, *, relative_path: str, source: int) -> ModuleInfo:
+    def extract_module(
+        self,
+        path: Path,
+        module_name: str,
+        *,
+        relative_path: str,
+        source: int,
+        content: bytes | None = None,
+    ) -> ModuleInfo:
         """Extract module information from a Python file.
 
         Parameters
@@ -68,13 +76,15 @@ class SymbolExtractor:
             Module path relative to its source root (POSIX style).
         source
             Index of the source root this module belongs to.
+        content
+            Already-read file bytes (skips reading `path` when provided).
 
         Returns
         -------
         ModuleInfo
             Extracted module information.
         """
-        tree = self._parser.parse_file(path)
+        tree = self._parser.parse_file(path) if content is None else self._parser.parse(content)
         root = tree.root_node
         if root.has_error:
             raise ValueError(f"Parse errors encountered in {path}")
@@ -6,13 +6,25 @@ existing extractor at signature resolution.
 
 from __future__ import annotations
 
+import io
+from operator import attrgetter
 from pathlib import Path
 
-from anatomize.core.extractor import SymbolExtractor
-from anatomize.core.types import ClassInfo, FunctionInfo, ModuleInfo, ResolutionLevel
+from anatomize.core.types import ClassInfo, FunctionInfo, ModuleInfo
+from anatomize.pack.extract_cache import extract_module_cached
 
+# Extraction lists decorated definitions after plain ones, so members are re-sorted into source order.
+_BY_LINE = attrgetter("line", "name")
 
-def compress_python_file(path: Path, *, module_name: str, relative_posix: str) -> str:
+
+def compress_python_file(
+    path: Path,
+    *,
+    module_name: str,
+    relative_posix: str,
+    cache_dir: Path | None = None,
+    content: bytes | None = None,
+) -> str:
     """Compress a Python file to a structural stub representation.
 
     Extracts the module's structure at signature resolution and renders
@@ -26,14 +38,19 @@ def compress_python_file(path: Path, *, module_name: str, relative_posix: str) -
         Fully qualified module name (e.g., 'pkg.sub.module').
     relative_posix
         Path relative to the source root (POSIX style).
+    cache_dir
+        Optional directory for persistent extraction cache entries.
+    content
+        Already-read file bytes (skips reading `path` when provided).
 
     Returns
     -------
     str
         Compressed Python stub representation.
     """
-    extractor = SymbolExtractor(resolution=ResolutionLevel.SIGNATURES)
-    info = extractor.extract_module(path, module_name, relative_path=relative_posix, source=0)
+    info = extract_module_cached(
+        path, module_name=module_name, relative_path=relative_posix, cache_dir=cache_dir, content=content
+    )
     return render_module(info)
 
 
@@ -57,68 +74,62 @@ def render_module(info: ModuleInfo) -> str:
     str
         Python stub representation ending with a newline.
     """
-    lines: list[str] = []
+    buf = io.StringIO()
     if info.doc:
-        lines.append(f'""" {info.doc} """')
+        buf.write(f'""" {info.doc} """\n')
 
     for imp in info.imports:
-        lines.append(imp)
+        buf.write(imp)
+        buf.write("\n")
 
     if info.constants:
-        lines.append("")
-        for c in sorted(info.constants, key=lambda x: (x.line, x.name)):
+        buf.write("\n")
+        for c in sorted(info.constants, key=_BY_LINE):
             if c.annotation and c.default:
-                lines.append(f"{c.name}: {c.annotation} = {c.default}")
+                buf.write(f"{c.name}: {c.annotation} = {c.default}\n")
             elif c.annotation:
-                lines.append(f"{c.name}: {c.annotation}")
+                buf.write(f"{c.name}: {c.annotation}\n")
             elif c.default:
-                lines.append(f"{c.name} = {c.default}")
+                buf.write(f"{c.name} = {c.default}\n")
             else:
-                lines.append(c.name)
+                buf.write(f"{c.name}\n")
 
-    for fn in sorted(info.functions, key=lambda f: (f.line, f.name)):
-        lines.extend(_render_function(fn))
+    for fn in sorted(info.functions, key=_BY_LINE):
+        _render_function(fn, out=buf)
 
-    for cls in sorted(info.classes, key=lambda c: (c.line, c.name)):
-        lines.extend(_render_class(cls))
+    for cls in sorted(info.classes, key=_BY_LINE):
+        _render_class(cls, out=buf)
 
-    return "\n".join(lines).rstrip() + "\n"
+    return buf.getvalue().rstrip() + "\n"
 
 
-def _render_function(fn: FunctionInfo, *, indent: str = "") -> list[str]:
-    out: list[str] = []
-    out.append("")
+def _render_function(fn: FunctionInfo, *, indent: str = "", out: io.StringIO) -> None:
+    out.write("\n")
     for dec in fn.decorators:
-        out.append(f"{indent}@{dec}")
+        out.write(f"{indent}@{dec}\n")
     prefix = "async " if fn.is_async else ""
-    out.append(f"{indent}{prefix}def {fn.name}{fn.signature}: ...")
-    return out
+    out.write(f"{indent}{prefix}def {fn.name}{fn.signature}: ...\n")
 
 
-def _render_class(cls: ClassInfo) -> list[str]:
-    out: list[str] = []
-    out.append("")
+def _render_class(cls: ClassInfo, *, out: io.StringIO) -> None:
+    out.write("\n")
     for dec in cls.decorators:
-        out.append(f"@{dec}")
+        out.write(f"@{dec}\n")
     bases = f"({', '.join(cls.bases)})" if cls.bases else ""
-    out.append(f"class {cls.name}{bases}:")
+    out.write(f"class {cls.name}{bases}:\n")
 
-    body: list[str] = []
-    for a in sorted(cls.attributes, key=lambda x: (x.line, x.name)):
+    for a in sorted(cls.attributes, key=_BY_LINE):
         if a.annotation and a.default:
-            body.append(f"    {a.name}: {a.annotation} = {a.default}")
+            out.write(f"    {a.name}: {a.annotation} = {a.default}\n")
         elif a.annotation:
-            body.append(f"    {a.name}: {a.annotation}")
+            out.write(f"    {a.name}: {a.annotation}\n")
         elif a.default:
-            body.append(f"    {a.name} = {a.default}")
+            out.write(f"    {a.name} = {a.default}\n")
         else:
-            body.append(f"    {a.name}")
-
-    for m in sorted(cls.methods, key=lambda f: (f.line, f.name)):
-        body.extend(_render_function(m, indent="    "))
+            out.write(f"    {a.name}\n")
 
-    if not body:
-        body.append("    ...")
+    for m in sorted(cls.methods, key=_BY_LINE):
+        _render_function(m, indent="    ", out=out)
 
-    out.extend(body)
-    return out
+    if not cls.attributes and not cls.methods:
+        out.write("    ...\n")
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import codecs
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 from anatomize.core.exclude import Excluder
 from anatomize.core.policy import SymlinkPolicy
+from anatomize.pack.fileio import read_file_bytes
 from anatomize.pack.match import GlobMatcher
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoveredPath:
     """A discovered file or directory in the repository.
 
@@ -38,7 +41,7 @@ class DiscoveredPath:
     is_binary: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoveryTraceItem:
     """Trace record explaining a discovery decision.
 
@@ -67,6 +70,14 @@ class DiscoveryTraceItem:
     matched_source: str | None
 
 
+# Bytes that occur in text files (the classic `file(1)` heuristic): printable ASCII, BEL/BS/TAB/LF/FF/CR/ESC,
+# and all high bytes (checked as UTF-8 separately).
+_TEXTCHARS = bytes({7, 8, 9, 10, 12, 13, 27}) + bytes(range(0x20, 0x7F)) + bytes(range(0x80, 0x100))
+
+# Text files up to this size are read whole during discovery when the caller collects `contents`.
+_KEEP_CONTENT_BYTES = 256 * 1024
+
+
 def discover_paths(
     root: Path,
     *,
@@ -75,6 +86,7 @@ def discover_paths(
     symlinks: SymlinkPolicy,
     max_file_bytes: int,
     trace: list[DiscoveryTraceItem] | None = None,
+    contents: dict[Path, bytes] | None = None,
 ) -> list[DiscoveredPath]:
     """Discover all files and directories in a repository.
 
@@ -95,6 +107,9 @@ def discover_paths(
         Maximum file size in bytes (0 for unlimited).
     trace
         Optional list to receive discovery decision traces.
+    contents
+        Optional dict to receive the bytes of small text files, keyed by
+        absolute path, so callers that read them can skip a second read.
 
     Returns
     -------
@@ -114,15 +129,38 @@ def discover_paths(
 
     results: list[DiscoveredPath] = []
 
-    # Manual recursion gives us deterministic traversal + easy symlink control.
-    def walk_dir(abs_dir: Path, rel_dir_posix: str) -> None:
-        entries = sorted(abs_dir.iterdir(), key=lambda p: p.name)
+    results.append(
+        DiscoveredPath(
+            absolute_path=root,
+            relative_posix=".",
+            is_dir=True,
+            is_symlink=root.is_symlink(),
+            size_bytes=0,
+            is_binary=False,
+        )
+    )
+
+    # Explicit-stack traversal over `os.scandir` gives us deterministic ordering, easy symlink control,
+    # and cached `DirEntry` type/stat lookups (one directory read instead of a stat per entry).
+    # Each directory also records whether its path is canonical (no followed symlink on the way down from the
+    # resolved root): entries below a canonical directory that are not symlinks themselves need no `resolve()`.
+    stack: list[tuple[str, str, bool]] = [(str(root), "", True)]
+    # Loop-invariant policy decisions, evaluated once instead of per entry.
+    follow_dir_links = symlinks in (SymlinkPolicy.DIRS, SymlinkPolicy.ALL)
+    follow_file_links = symlinks in (SymlinkPolicy.FILES, SymlinkPolicy.ALL)
+    has_includes = bool(include_patterns)
+    while stack:
+        abs_dir, rel_dir_posix, canonical_dir = stack.pop()
+        with os.scandir(abs_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        subdirs: list[tuple[str, str, bool]] = []
         for entry in entries:
             is_symlink = entry.is_symlink()
             if is_symlink:
-                if entry.is_dir() and symlinks not in (SymlinkPolicy.DIRS, SymlinkPolicy.ALL):
+                if not follow_dir_links and entry.is_dir():
                     continue
-                if entry.is_file() and symlinks not in (SymlinkPolicy.FILES, SymlinkPolicy.ALL):
+                if not follow_file_links and entry.is_file():
                     continue
 
             rel = f"{rel_dir_posix}/{entry.name}" if rel_dir_posix else entry.name
@@ -131,14 +169,13 @@ def discover_paths(
             try:
                 is_dir = entry.is_dir()
             except OSError as e:
-                raise ValueError(f"Failed to stat path: {entry}") from e
+                raise ValueError(f"Failed to stat path: {entry.path}") from e
 
             excluded, matched = excluder.explain(rel_posix, is_dir=is_dir)
             if excluded:
                 if trace is not None:
-                    matched_pattern = None
-                    if matched is not None:
-                        matched_pattern = matched.pattern + ("/" if matched.directory_only else "")
+                    # The display string is built once per rule, so excluded entries share it.
+                    matched_pattern = matched.display_pattern if matched is not None else None
                     trace.append(
                         DiscoveryTraceItem(
                             path=rel_posix,
@@ -151,11 +188,24 @@ def discover_paths(
                     )
                 continue
 
-            if include_patterns and not include_matcher.matches_any(rel_posix, is_dir=is_dir):
+            if has_includes and not include_matcher.matches_any(rel_posix, is_dir=is_dir):
                 # If the user provided an allowlist, exclude anything that doesn't match.
                 # Note: directories can still be traversed if they match via a descendant;
-                # our simple include matcher cannot prove that cheaply, so we traverse all
-                # non-excluded directories and filter files at the leaf.
+                # we only prune directories the include patterns provably cannot reach
+                # (anchored literal prefixes), and filter files at the leaf.
+                if is_dir and not include_matcher.could_match_under(rel_posix):
+                    if trace is not None:
+                        trace.append(
+                            DiscoveryTraceItem(
+                                path=rel_posix,
+                                is_dir=True,
+                                decision="excluded",
+                                reason="include",
+                                matched_pattern=None,
+                                matched_source=None,
+                            )
+                        )
+                    continue
                 if not is_dir:
                     if trace is not None:
                         trace.append(
@@ -170,10 +220,13 @@ def discover_paths(
                         )
                     continue
 
+            entry_path = Path(entry.path)
+            canonical = canonical_dir and not is_symlink
+            absolute_path = entry_path if canonical else entry_path.resolve()
             if is_dir:
                 results.append(
                     DiscoveredPath(
-                        absolute_path=entry.resolve(),
+                        absolute_path=absolute_path,
                         relative_posix=rel_posix,
                         is_dir=True,
                         is_symlink=is_symlink,
@@ -181,17 +234,19 @@ def discover_paths(
                         is_binary=False,
                     )
                 )
-                walk_dir(entry, rel_posix)
+                subdirs.append((entry.path, rel_posix, canonical))
                 continue
 
             size = entry.stat().st_size
             if max_file_bytes > 0 and size > max_file_bytes:
                 raise ValueError(f"File exceeds max size ({max_file_bytes} bytes): {rel_posix} ({size} bytes)")
 
-            is_binary = _is_binary_file(entry)
+            is_binary, content = _sniff_file(entry_path, size=size, keep=contents is not None)
+            if contents is not None and content is not None:
+                contents[absolute_path] = content
             results.append(
                 DiscoveredPath(
-                    absolute_path=entry.resolve(),
+                    absolute_path=absolute_path,
                     relative_posix=rel_posix,
                     is_dir=False,
                     is_symlink=is_symlink,
@@ -211,33 +266,43 @@ def discover_paths(
                     )
                 )
 
-    results.append(
-        DiscoveredPath(
-            absolute_path=root,
-            relative_posix=".",
-            is_dir=True,
-            is_symlink=root.is_symlink(),
-            size_bytes=0,
-            is_binary=False,
-        )
-    )
-    walk_dir(root, "")
+        # Push in reverse so subdirectories are visited in lexicographic order.
+        stack.extend(reversed(subdirs))
 
     # Deterministic ordering: directories first, then files, both lexicographic by rel path.
     results.sort(key=lambda d: (0 if d.is_dir else 1, d.relative_posix))
     return results
 
 
-def _is_binary_file(path: Path, *, sniff_bytes: int = 8192) -> bool:
+def _sniff_file(path: Path, *, size: int, keep: bool, sniff_bytes: int = 8192) -> tuple[bool, bytes | None]:
+    # Only `sniff_bytes` are read to classify; with `keep`, the bytes of a text file up to `_KEEP_CONTENT_BYTES`
+    # are returned too, reusing the prefix when it already holds the whole file. Binaries are never read past it.
     try:
-        with path.open("rb") as f:
-            data = f.read(sniff_bytes)
+        prefix = read_file_bytes(path, limit=sniff_bytes)
     except OSError:
+        return True, None
+    complete = len(prefix) < sniff_bytes
+    if _is_binary_prefix(prefix, complete=complete):
+        return True, None
+    if not keep or size > _KEEP_CONTENT_BYTES:
+        return False, None
+    if complete:
+        return False, prefix
+    try:
+        return False, read_file_bytes(path)
+    except OSError:
+        return False, None
+
+
+def _is_binary_prefix(data: bytes, *, complete: bool) -> bool:
+    # Any byte outside the text set (NUL and other control characters) means binary.
+    if data.translate(None, _TEXTCHARS):
         return True
-    if b"\x00" in data:
-        return True
+    if data.isascii():
+        return False
+    # High bytes must form valid UTF-8; unless `data` is the whole file, a multi-byte sequence may be cut at the end.
     try:
-        data.decode("utf-8")
+        codecs.getincrementaldecoder("utf-8")().decode(data, final=complete)
     except UnicodeDecodeError:
         return True
     return False
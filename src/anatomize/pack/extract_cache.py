@@ -0,0 +1,256 @@
+"""Content-addressed cache of extracted Python module structure for `pack`.
+
+Compression and hybrid summaries both need a signature-level `ModuleInfo` for
+each `.py` file, often for the same file more than once per run. Results are
+keyed by the SHA-256 of the file bytes, kept in a bounded in-memory LRU, and
+optionally persisted as JSON under a cache directory so repeated runs skip
+parsing entirely for unchanged files. `extract_many` fills the cache for a
+batch of files using worker processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from anatomize.core.extractor import SymbolExtractor
+from anatomize.core.types import ModuleInfo, ResolutionLevel
+from anatomize.version import __version__
+
+_MAX_MEMORY_ENTRIES = 4096
+
+# Below this many cache misses, worker start-up costs more than parsing in-process.
+_MIN_PROCESS_BATCH = 16
+
+# Disk entries are only valid for the extractor and interpreter that produced them.
+_DISK_NAMESPACE = f"anatomize-{__version__}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+_memory: OrderedDict[str, ModuleInfo] = OrderedDict()
+_lock = threading.Lock()
+
+
+def extract_module_cached(
+    path: Path,
+    *,
+    module_name: str,
+    relative_path: str,
+    cache_dir: Path | None = None,
+    content: bytes | None = None,
+) -> ModuleInfo:
+    """Extract signature-level module info, reusing cached results for identical content.
+
+    Parameters
+    ----------
+    path
+        Absolute path to the Python file.
+    module_name
+        Fully qualified module name (e.g., 'pkg.sub.module').
+    relative_path
+        Path relative to the source root (POSIX style).
+    cache_dir
+        Optional directory for persistent cache entries (None for memory only).
+    content
+        Already-read file bytes (skips reading `path` when provided).
+
+    Returns
+    -------
+    ModuleInfo
+        Extracted module information for `path`.
+    """
+    if content is None:
+        content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+
+    info = _cache_get(digest, cache_dir)
+    if info is None:
+        # Extractors hold per-parse state, so each miss uses its own instance (safe under threads).
+        extractor = SymbolExtractor(resolution=ResolutionLevel.SIGNATURES)
+        info = extractor.extract_module(path, module_name, relative_path=relative_path, source=0, content=content)
+        _cache_put(digest, info, cache_dir)
+    return _with_identity(info, module_name=module_name, relative_path=relative_path)
+
+
+def extract_many(
+    tasks: Sequence[tuple[Path, str, str]],
+    *,
+    workers: int,
+    cache_dir: Path | None = None,
+    contents: Mapping[Path, bytes] | None = None,
+) -> dict[str, ModuleInfo]:
+    """Extract signature-level module info for many files, parsing cache misses in worker processes.
+
+    Extraction is CPU-bound Python work that holds the GIL, so threads do not speed it up.
+    Workers return `ModuleInfo.model_dump_json()` strings, which are cheap to pickle. The
+    parent validates them back into models and stores them in the cache.
+
+    Parameters
+    ----------
+    tasks
+        `(path, module_name, relative_path)` for each module.
+    workers
+        Maximum number of worker processes (1 extracts in-process).
+    cache_dir
+        Optional directory for persistent cache entries (None for memory only).
+    contents
+        Already-read file bytes keyed by path (tasks whose path is missing are read from disk).
+
+    Returns
+    -------
+    dict[str, ModuleInfo]
+        Module info keyed by relative path. Modules that cannot be read or parsed are omitted,
+        so callers can retry them with `extract_module_cached` and report the error in context.
+    """
+    found: dict[str, ModuleInfo] = {}
+    # Identical content is parsed once, then re-labelled for every path that shares it.
+    owners: dict[str, list[tuple[str, str]]] = {}
+    jobs: dict[str, tuple[str, str, str, bytes]] = {}
+    for path, module_name, relative_path in tasks:
+        content = contents.get(path) if contents is not None else None
+        if content is None:
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+        digest = hashlib.sha256(content).hexdigest()
+        info = _cache_get(digest, cache_dir)
+        if info is not None:
+            found[relative_path] = _with_identity(info, module_name=module_name, relative_path=relative_path)
+            continue
+        owners.setdefault(digest, []).append((module_name, relative_path))
+        jobs.setdefault(digest, (str(path), module_name, relative_path, content))
+
+    if not jobs:
+        return found
+
+    payloads = list(jobs.values())
+    dumped: list[str | None] | None = None
+    n_procs = min(workers, len(payloads), os.cpu_count() or 1)
+    if n_procs > 1 and len(payloads) >= _MIN_PROCESS_BATCH:
+        try:
+            with ProcessPoolExecutor(max_workers=n_procs, initializer=_init_worker) as pool:
+                chunksize = max(1, len(payloads) // (n_procs * 4))
+                dumped = list(pool.map(_extract_in_worker, payloads, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            # Platforms without working process support still get a correct (serial) result.
+            dumped = None
+    if dumped is None:
+        extractor = SymbolExtractor(resolution=ResolutionLevel.SIGNATURES)
+        dumped = [_dump_module(extractor, payload) for payload in payloads]
+
+    for digest, text in zip(jobs, dumped):
+        if text is None:
+            continue
+        info = ModuleInfo.model_validate_json(text)
+        _cache_put(digest, info, cache_dir)
+        for module_name, relative_path in owners[digest]:
+            found[relative_path] = _with_identity(info, module_name=module_name, relative_path=relative_path)
+    return found
+
+
+def clear_extract_cache() -> None:
+    """Drop all in-memory cache entries."""
+    with _lock:
+        _memory.clear()
+
+
+_worker_extractor: SymbolExtractor | None = None
+
+
+def _init_worker() -> None:
+    global _worker_extractor
+    _worker_extractor = SymbolExtractor(resolution=ResolutionLevel.SIGNATURES)
+
+
+def _extract_in_worker(payload: tuple[str, str, str, bytes]) -> str | None:
+    if _worker_extractor is None:  # pragma: no cover - the pool always runs _init_worker first
+        raise RuntimeError("Extraction worker was not initialized")
+    return _dump_module(_worker_extractor, payload)
+
+
+def _dump_module(extractor: SymbolExtractor, payload: tuple[str, str, str, bytes]) -> str | None:
+    path, module_name, relative_path, content = payload
+    try:
+        info = extractor.extract_module(
+            Path(path), module_name, relative_path=relative_path, source=0, content=content
+        )
+    except Exception:
+        return None
+    return info.model_dump_json()
+
+
+def _with_identity(info: ModuleInfo, *, module_name: str, relative_path: str) -> ModuleInfo:
+    if info.name == module_name and info.path == relative_path:
+        return info
+    # Identical content at another location (e.g. empty `__init__.py` files): only identity differs.
+    return info.model_copy(update={"name": module_name, "path": relative_path})
+
+
+def _cache_get(digest: str, cache_dir: Path | None) -> ModuleInfo | None:
+    info = _memory_get(digest)
+    if info is None and cache_dir is not None:
+        info = _disk_get(cache_dir, digest)
+        if info is not None:
+            _memory_put(digest, info)
+    return info
+
+
+def _cache_put(digest: str, info: ModuleInfo, cache_dir: Path | None) -> None:
+    _memory_put(digest, info)
+    if cache_dir is not None:
+        _disk_put(cache_dir, digest, info)
+
+
+def _memory_get(digest: str) -> ModuleInfo | None:
+    with _lock:
+        info = _memory.get(digest)
+        if info is not None:
+            _memory.move_to_end(digest)
+        return info
+
+
+def _memory_put(digest: str, info: ModuleInfo) -> None:
+    with _lock:
+        _memory[digest] = info
+        _memory.move_to_end(digest)
+        while len(_memory) > _MAX_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def _disk_path(cache_dir: Path, digest: str) -> Path:
+    return cache_dir / _DISK_NAMESPACE / f"{digest}.json"
+
+
+def _disk_get(cache_dir: Path, digest: str) -> ModuleInfo | None:
+    try:
+        text = _disk_path(cache_dir, digest).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    try:
+        return ModuleInfo.model_validate_json(text)
+    except ValidationError:
+        # Corrupt or stale entries are treated as misses and overwritten.
+        return None
+
+
+def _disk_put(cache_dir: Path, digest: str, info: ModuleInfo) -> None:
+    dst = _disk_path(cache_dir, digest)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(info.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, dst)
+    except OSError:
+        # The cache is an optimization; failing to persist must not fail the pack.
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
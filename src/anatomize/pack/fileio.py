@@ -0,0 +1,66 @@
+"""Low-overhead file reads for `pack`.
+
+`pack` reads every selected file whole (or a fixed prefix for binary
+sniffing). Going through `os.open`/`os.read` avoids constructing a buffered
+reader (and text wrapper) per file and reads regular files in a single call.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def read_file_bytes(path: Path, *, limit: int | None = None) -> bytes:
+    """Read a file's bytes without buffered I/O.
+
+    Parameters
+    ----------
+    path
+        File to read.
+    limit
+        Maximum number of bytes to read from the start of the file (None for the whole file).
+
+    Returns
+    -------
+    bytes
+        File content (or its prefix when `limit` is set).
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened or read.
+    """
+    fd = os.open(path, _OPEN_FLAGS)
+    try:
+        if limit is not None:
+            return os.read(fd, limit)
+        size = os.fstat(fd).st_size
+        # Ask for one byte more than the reported size: a regular file then returns everything in one call,
+        # and anything else (file grew, size unknown such as procfs) falls through to a read-to-EOF loop.
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, 1 << 16):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def read_file_text(path: Path) -> str:
+    """Read a UTF-8 text file without buffered I/O.
+
+    Unlike `Path.read_text`, newlines are not translated (`\\r\\n` is preserved).
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened or read.
+    UnicodeDecodeError
+        If the content is not valid UTF-8.
+    """
+    return read_file_bytes(path).decode("utf-8")
@@ -10,6 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from anatomize.core.exclude import Excluder, IgnorePattern
+from anatomize.pack.fileio import read_file_text
 
 DEFAULT_IGNORE_PATTERNS: list[str] = [
     "__pycache__/",
@@ -84,7 +85,7 @@ def build_excluder(
 
 def _read_patterns_file(path: Path) -> list[str]:
     try:
-        text = path.read_text(encoding="utf-8")
+        text = read_file_text(path)
     except OSError as e:
         raise ValueError(f"Failed to read ignore file: {path}") from e
     return [line.rstrip("\n") for line in text.splitlines()]
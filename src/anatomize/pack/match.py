@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
-from functools import cache
-from pathlib import PurePosixPath
 
-from anatomize.core.exclude import parse_ignore_line
+from anatomize.core.exclude import compile_alternation, match_key, parse_ignore_line, rule_regex
 
 
 @dataclass(frozen=True)
@@ -72,6 +69,18 @@ class GlobMatcher:
                 GlobRule(pattern=raw, anchored=anchored, directory_only=directory_only, has_slash=has_slash)
             )
 
+        self._dir_regex = compile_alternation([rule_regex(r, is_dir=True) for r in self._rules])
+        self._file_regex = compile_alternation([rule_regex(r, is_dir=False) for r in self._rules])
+
+        # Literal path heads of anchored rules, used to prune traversal. Unanchored rules can match
+        # at any depth, so a single one disables pruning (None).
+        self._anchored_heads: list[str] | None = []
+        for rule in self._rules:
+            if not rule.anchored:
+                self._anchored_heads = None
+                break
+            self._anchored_heads.append(_literal_head(rule.pattern))
+
     def matches_any(self, rel_posix: str, *, is_dir: bool) -> bool:
         """Check if a path matches any pattern.
 
@@ -87,64 +96,40 @@ class GlobMatcher:
         bool
             True if any pattern matches.
         """
-        rel_posix = rel_posix.strip("/")
-        path = PurePosixPath(rel_posix) if rel_posix else PurePosixPath(".")
-        for rule in self._rules:
-            if self._matches(path, rule, is_dir=is_dir):
-                return True
-        return False
-
-    def _matches(self, path: PurePosixPath, rule: GlobRule, *, is_dir: bool) -> bool:
-        if rule.directory_only:
-            if is_dir and self._match_single(path, rule):
-                return True
-            for parent in path.parents:
-                if self._match_single(parent, rule):
-                    return True
-            return False
-        return self._match_single(path, rule)
-
-    def _match_single(self, path: PurePosixPath, rule: GlobRule) -> bool:
-        pattern = rule.pattern
-
-        path_parts = tuple(p for p in path.parts if p != ".")
-        pat_parts = tuple(part for part in pattern.split("/") if part)
-
-        if not rule.has_slash and not rule.anchored:
-            if not path_parts:
-                return False
-            return fnmatchcase(path_parts[-1], pattern)
-
-        if rule.anchored:
-            return _match_parts(pat_parts, path_parts)
-
-        for start in range(len(path_parts) + 1):
-            if _match_parts(pat_parts, path_parts[start:]):
-                return True
-        return False
+        regex = self._dir_regex if is_dir else self._file_regex
+        return regex is not None and regex.match(match_key(rel_posix)) is not None
 
+    def could_match_under(self, rel_dir_posix: str) -> bool:
+        """Check if any pattern could match a path beneath a directory.
 
-@cache
-def _match_parts(pat_parts: tuple[str, ...], path_parts: tuple[str, ...]) -> bool:
-    return _match_parts_at(pat_parts, 0, path_parts, 0)
+        This is a conservative check based on the literal prefix of anchored
+        patterns: False means no descendant of the directory can match.
 
+        Parameters
+        ----------
+        rel_dir_posix
+            Relative directory path in POSIX format.
 
-@cache
-def _match_parts_at(pat_parts: tuple[str, ...], pi: int, path_parts: tuple[str, ...], si: int) -> bool:
-    if pi == len(pat_parts):
-        return si == len(path_parts)
-
-    pat = pat_parts[pi]
-    if pat == "**":
-        for k in range(si, len(path_parts) + 1):
-            if _match_parts_at(pat_parts, pi + 1, path_parts, k):
-                return True
-        return False
-
-    if si == len(path_parts):
-        return False
-
-    if not fnmatchcase(path_parts[si], pat):
-        return False
-
-    return _match_parts_at(pat_parts, pi + 1, path_parts, si + 1)
+        Returns
+        -------
+        bool
+            False if the directory can be skipped entirely.
+        """
+        if self._anchored_heads is None:
+            return True
+        key = match_key(rel_dir_posix)
+        return any(head.startswith(key) or key.startswith(head) for head in self._anchored_heads)
+
+
+def _literal_head(pattern: str) -> str:
+    # Segment-aligned literal prefix up to the first wildcard (e.g. `src/pkg/*.py` -> `src/pkg/`).
+    head: list[str] = []
+    for part in pattern.split("/"):
+        if not part:
+            continue
+        cut = min((i for i, c in enumerate(part) if c in "*?["), default=-1)
+        if cut >= 0:
+            head.append(part[:cut])
+            break
+        head.append(f"{part}/")
+    return "".join(head)
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from fnmatch import fnmatchcase
-from functools import cache
-from pathlib import PurePosixPath
 
-from anatomize.core.exclude import parse_ignore_line
+from anatomize.core.exclude import compile_glob, parse_ignore_line
 
 
 class FileRepresentation(str, Enum):
@@ -45,6 +43,10 @@ class RepresentationRule:
         True if pattern was '/'-suffixed.
     has_slash
         True if pattern contains a path separator.
+    compiled
+        Whole pattern compiled to a regex (used for basename matching).
+    compiled_parts
+        Per-segment compiled regexes (`None` for a `**` segment).
     """
 
     pattern: str
@@ -52,6 +54,8 @@ class RepresentationRule:
     anchored: bool
     directory_only: bool
     has_slash: bool
+    compiled: re.Pattern[str] = field(compare=False, repr=False)
+    compiled_parts: tuple[re.Pattern[str] | None, ...] = field(compare=False, repr=False)
 
 
 def compile_representation_rules(patterns: list[str], representation: FileRepresentation) -> list[RepresentationRule]:
@@ -96,6 +100,8 @@ def compile_representation_rules(patterns: list[str], representation: FileRepres
                 anchored=anchored,
                 directory_only=directory_only,
                 has_slash=has_slash,
+                compiled=compile_glob(pat),
+                compiled_parts=tuple(None if part == "**" else compile_glob(part) for part in pat.split("/") if part),
             )
         )
     return rules
@@ -112,6 +118,36 @@ class RepresentationPolicy:
     """
 
     rules: list[RepresentationRule]
+    # Rules are bucketed once so `resolve` only looks at rules that can match a given path:
+    # - plain basenames (e.g. `Makefile`): index of the last such rule per name;
+    # - anchored rules starting with a literal segment (e.g. `/src/*.py`): only paths under that segment;
+    # - everything else: always scanned.
+    # Scan lists are ordered last-first, so the first match is the winning rule.
+    _literal_basenames: dict[str, int] = field(init=False, repr=False, compare=False)
+    _scan_by_first_segment: dict[str, tuple[tuple[int, RepresentationRule], ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _scan_order: tuple[tuple[int, RepresentationRule], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        literal_basenames: dict[str, int] = {}
+        anchored: dict[str, list[tuple[int, RepresentationRule]]] = {}
+        generic: list[tuple[int, RepresentationRule]] = []
+        for index, rule in enumerate(self.rules):
+            head = _anchored_literal_head(rule)
+            if _is_literal_basename(rule):
+                literal_basenames[rule.pattern] = index
+            elif head is not None:
+                anchored.setdefault(head, []).append((index, rule))
+            else:
+                generic.append((index, rule))
+        by_first_segment = {
+            head: tuple(sorted(bucket + generic, key=lambda item: item[0], reverse=True))
+            for head, bucket in anchored.items()
+        }
+        object.__setattr__(self, "_literal_basenames", literal_basenames)
+        object.__setattr__(self, "_scan_by_first_segment", by_first_segment)
+        object.__setattr__(self, "_scan_order", tuple(reversed(generic)))
 
     def resolve(self, rel_posix: str, *, is_dir: bool, default: FileRepresentation) -> FileRepresentation:
         """Resolve the representation for a path.
@@ -130,67 +166,96 @@ class RepresentationPolicy:
         FileRepresentation
             Resolved representation (last matching rule wins).
         """
-        rel_posix = rel_posix.strip("/")
-        path = PurePosixPath(rel_posix) if rel_posix else PurePosixPath(".")
-        rep = default
-        for rule in self.rules:
-            if _matches(path, rule, is_dir=is_dir):
-                rep = rule.representation
-        return rep
-
-
-def _matches(path: PurePosixPath, rule: RepresentationRule, *, is_dir: bool) -> bool:
+        # Same normalization as `PurePosixPath(rel_posix).parts`, without building path objects.
+        path_parts = tuple(p for p in rel_posix.split("/") if p and p != ".")
+        # The last matching rule wins: a literal basename hit settles every earlier rule, so only later
+        # rules are scanned (last-first, stopping at the first match).
+        if path_parts:
+            literal = self._literal_basenames.get(path_parts[-1], -1)
+            scan = self._scan_by_first_segment.get(path_parts[0], self._scan_order)
+        else:
+            literal, scan = -1, self._scan_order
+        for index, rule in scan:
+            if index < literal:
+                break
+            if _matches(path_parts, rule, is_dir=is_dir):
+                return rule.representation
+        return self.rules[literal].representation if literal >= 0 else default
+
+
+def _is_literal_basename(rule: RepresentationRule) -> bool:
+    return not (
+        rule.has_slash
+        or rule.anchored
+        or rule.directory_only
+        or "*" in rule.pattern
+        or "?" in rule.pattern
+        or "[" in rule.pattern
+    )
+
+
+def _anchored_literal_head(rule: RepresentationRule) -> str | None:
+    # An anchored rule whose first segment has no glob characters can only match paths (or, for
+    # directory-only rules, parents) that start with that segment.
+    if not rule.anchored:
+        return None
+    head = next((part for part in rule.pattern.split("/") if part), "")
+    if not head or head == "**" or "*" in head or "?" in head or "[" in head:
+        return None
+    return head
+
+
+def _matches(path_parts: tuple[str, ...], rule: RepresentationRule, *, is_dir: bool) -> bool:
     if rule.directory_only:
-        if is_dir and _match_single(path, rule):
+        if is_dir and _match_single(path_parts, rule):
             return True
-        for parent in path.parents:
-            if _match_single(parent, rule):
+        # Parents from nearest to the root (the empty tuple).
+        for i in range(len(path_parts) - 1, -1, -1):
+            if _match_single(path_parts[:i], rule):
                 return True
         return False
-    return _match_single(path, rule)
-
+    return _match_single(path_parts, rule)
 
-def _match_single(path: PurePosixPath, rule: RepresentationRule) -> bool:
-    pattern = rule.pattern
-
-    path_parts = tuple(p for p in path.parts if p != ".")
-    pat_parts = tuple(part for part in pattern.split("/") if part)
 
+def _match_single(path_parts: tuple[str, ...], rule: RepresentationRule) -> bool:
     if not rule.has_slash and not rule.anchored:
         if not path_parts:
             return False
-        return fnmatchcase(path_parts[-1], pattern)
-
-    if rule.anchored:
-        return _match_parts(pat_parts, path_parts)
-
-    for start in range(len(path_parts) + 1):
-        if _match_parts(pat_parts, path_parts[start:]):
-            return True
-    return False
-
-
-@cache
-def _match_parts(pat_parts: tuple[str, ...], path_parts: tuple[str, ...]) -> bool:
-    return _match_parts_at(pat_parts, 0, path_parts, 0)
-
-
-@cache
-def _match_parts_at(pat_parts: tuple[str, ...], pi: int, path_parts: tuple[str, ...], si: int) -> bool:
-    if pi == len(pat_parts):
-        return si == len(path_parts)
-
-    pat = pat_parts[pi]
-    if pat == "**":
-        for k in range(si, len(path_parts) + 1):
-            if _match_parts_at(pat_parts, pi + 1, path_parts, k):
-                return True
-        return False
-
-    if si == len(path_parts):
-        return False
+        return rule.compiled.match(path_parts[-1]) is not None
+
+    return _match_parts(rule.compiled_parts, path_parts, anchored=rule.anchored)
+
+
+def _match_parts(
+    pat_parts: tuple[re.Pattern[str] | None, ...], path_parts: tuple[str, ...], *, anchored: bool
+) -> bool:
+    # Simulate the pattern as an NFA over path segments: state `i` means `pat_parts[:i]` has matched.
+    # `**` (None) matches zero or more segments (epsilon to `i + 1`, or consume and stay). Unanchored patterns
+    # may start at any segment boundary, so state 0 is re-entered before every segment.
+    n = len(pat_parts)
+    active = [False] * (n + 1)
+    active[0] = True
+    _close(active, pat_parts)
+    for seg in path_parts:
+        nxt = [False] * (n + 1)
+        if not anchored:
+            nxt[0] = True
+        for i in range(n):
+            if not active[i]:
+                continue
+            pat = pat_parts[i]
+            if pat is None:
+                nxt[i] = True
+            elif pat.match(seg) is not None:
+                nxt[i + 1] = True
+        _close(nxt, pat_parts)
+        if not any(nxt):
+            return False
+        active = nxt
+    return active[n]
 
-    if not fnmatchcase(path_parts[si], pat):
-        return False
 
-    return _match_parts_at(pat_parts, pi + 1, path_parts, si + 1)
+def _close(active: list[bool], pat_parts: tuple[re.Pattern[str] | None, ...]) -> None:
+    for i, pat in enumerate(pat_parts):
+        if active[i] and pat is None:
+            active[i + 1] = True
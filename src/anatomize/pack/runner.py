@@ -6,16 +6,20 @@ import base64
 import json
 import os
 import tempfile
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 from anatomize.core.exclude import Excluder
 from anatomize.core.policy import SymlinkPolicy
-from anatomize.pack.compress import compress_python_file
+from anatomize.core.types import ModuleInfo
+from anatomize.pack.compress import compress_python_file, render_module
 from anatomize.pack.deps import PythonModuleIndex, dependency_closure, reverse_dependency_closure
 from anatomize.pack.discovery import DiscoveredPath, DiscoveryTraceItem, discover_paths
+from anatomize.pack.extract_cache import extract_many
 from anatomize.pack.formats import (
     ContentEncoding,
     PackFile,
@@ -120,6 +124,9 @@ def _process_one_file(
     python_roots: list[Path],
     compress: bool,
     line_numbers: bool,
+    extract_cache_dir: Path | None = None,
+    extracted: Mapping[str, ModuleInfo] | None = None,
+    data: bytes | None = None,
 ) -> tuple[str, PackFile, str | None]:
     from anatomize.pack.discovery import DiscoveredPath
 
@@ -133,10 +140,20 @@ def _process_one_file(
         return (rel_posix, PackFile(path=rel_posix, language=None, is_binary=True, content=None), None)
 
     try:
-        content = _read_text(abs_path)
+        content = _read_text(abs_path, content=data)
         if compress and abs_path.suffix == ".py":
-            module_name = _python_module_name_for_path(abs_path, root, python_roots=python_roots)
-            content = compress_python_file(abs_path, module_name=module_name, relative_posix=rel_posix)
+            info = extracted.get(rel_posix) if extracted is not None else None
+            if info is not None:
+                content = render_module(info)
+            else:
+                module_name = _python_module_name_for_path(abs_path, root, python_roots=python_roots)
+                content = compress_python_file(
+                    abs_path,
+                    module_name=module_name,
+                    relative_posix=rel_posix,
+                    cache_dir=extract_cache_dir,
+                    content=data,
+                )
         if line_numbers:
             content = _add_line_numbers(content)
     except Exception as e:
@@ -162,6 +179,9 @@ def _process_one_file_hybrid(
     policy: RepresentationPolicy,
     summary_cfg: SummaryConfig,
     include_files: bool,
+    extract_cache_dir: Path | None = None,
+    extracted: Mapping[str, ModuleInfo] | None = None,
+    data: bytes | None = None,
 ) -> tuple[JsonlFile, PackFile, int, dict[str, Any] | None, FileRepresentation]:
     from anatomize.pack.discovery import DiscoveredPath
 
@@ -216,7 +236,7 @@ def _process_one_file_hybrid(
         raise ValueError(f"Summary requested but --no-files is set: {rel_posix}")
 
     try:
-        raw_text = _read_text(abs_path)
+        raw_text = _read_text(abs_path, content=data)
     except Exception as e:
         raise ValueError(f"Failed to read {rel_posix}") from e
 
@@ -226,9 +246,18 @@ def _process_one_file_hybrid(
     content_field_tokens: int | None = None
 
     if rep is FileRepresentation.SUMMARY:
-        if abs_path.suffix == ".py":
+        info = extracted.get(rel_posix) if extracted is not None else None
+        if info is not None:
+            summary = info.model_dump(mode="json")
+        elif abs_path.suffix == ".py":
             module_name = _python_module_name_for_path(abs_path, root, python_roots=python_roots)
-            summary = python_summary(abs_path, module_name=module_name, relative_path=rel_posix)
+            summary = python_summary(
+                abs_path,
+                module_name=module_name,
+                relative_path=rel_posix,
+                cache_dir=extract_cache_dir,
+                content=data,
+            )
         else:
             summary = summary_for_text(
                 suffix=abs_path.suffix,
@@ -324,6 +353,7 @@ def pack(
     entries: list[Path],
     deps: bool,
     python_roots: list[Path],
+    extract_cache_dir: Path | None = None,
 ) -> PackResult:
     """Generate a deterministic pack of repository files.
 
@@ -353,7 +383,8 @@ def pack(
     max_file_bytes
         Maximum file size in bytes.
     workers
-        Number of parallel workers (0 for auto).
+        Number of parallel workers (0 for auto). Python extraction for compression and
+        summaries uses up to this many processes; everything else uses threads.
     token_encoding
         Token encoding for counting.
     compress
@@ -404,6 +435,8 @@ def pack(
         Compute transitive dependencies of entries.
     python_roots
         Python source roots for import resolution.
+    extract_cache_dir
+        Directory for persistent Python extraction cache entries (None for in-memory only).
 
     Returns
     -------
@@ -436,6 +469,9 @@ def pack(
     )
 
     trace: list[DiscoveryTraceItem] | None = [] if selection_report_output is not None else None
+    # Bytes of small text files, collected during discovery only when file contents will be read
+    # (hybrid mode reads them for token counts even with --no-files). Each entry is popped when used.
+    contents: dict[Path, bytes] = {}
     discovered = discover_paths(
         root,
         excluder=excluder,
@@ -443,6 +479,7 @@ def pack(
         symlinks=symlinks,
         max_file_bytes=max_file_bytes,
         trace=trace,
+        contents=contents if include_files or mode is PackMode.HYBRID else None,
     )
 
     file_paths = [d for d in discovered if not d.is_dir]
@@ -536,6 +573,8 @@ def pack(
         )
 
     selected_file_paths = [d for d in file_paths if selected_files is None or d.absolute_path in selected_files]
+    if selected_files is not None:
+        contents = {p: b for p, b in contents.items() if p in selected_files}
     if selection_report_output is not None:
         _write_selection_report(
             selection_report_output,
@@ -601,6 +640,8 @@ def pack(
                         policy=policy,
                         summary_cfg=summary_cfg,
                         include_files=include_files,
+                        extract_cache_dir=extract_cache_dir,
+                        data=contents.pop(f.absolute_path, None),
                     )
                     files.append(pf)
                     jsonl_files.append(jf)
@@ -608,6 +649,20 @@ def pack(
             else:
                 errors: list[str] = []
                 results_hybrid: dict[str, HybridProcessResult] = {}
+                extracted_hybrid: dict[str, ModuleInfo] | None = None
+                if include_files:
+                    summarized = [
+                        f
+                        for f in selected_file_paths
+                        if policy.resolve(f.relative_posix, is_dir=False, default=FileRepresentation.SUMMARY)
+                        is FileRepresentation.SUMMARY
+                    ]
+                    extracted_hybrid = extract_many(
+                        _python_extract_tasks(summarized, root=root, python_roots=resolved_python_roots),
+                        workers=workers_resolved,
+                        cache_dir=extract_cache_dir,
+                        contents=contents,
+                    )
                 with ThreadPoolExecutor(max_workers=workers_resolved) as executor_hybrid:
                     futures_hybrid = [
                         executor_hybrid.submit(
@@ -621,6 +676,9 @@ def pack(
                             policy=policy,
                             summary_cfg=summary_cfg,
                             include_files=include_files,
+                            extract_cache_dir=extract_cache_dir,
+                            extracted=extracted_hybrid,
+                            data=contents.pop(f.absolute_path, None),
                         )
                         for f in selected_file_paths
                     ]
@@ -649,6 +707,8 @@ def pack(
                         python_roots=resolved_python_roots,
                         compress=compress,
                         line_numbers=line_numbers,
+                        extract_cache_dir=extract_cache_dir,
+                        data=contents.pop(f.absolute_path, None),
                     )
                     files.append(pf)
                     if content is not None:
@@ -656,6 +716,14 @@ def pack(
             else:
                 errors_bundle: list[str] = []
                 results: dict[str, tuple[PackFile, str | None]] = {}
+                extracted_bundle: dict[str, ModuleInfo] | None = None
+                if compress:
+                    extracted_bundle = extract_many(
+                        _python_extract_tasks(selected_file_paths, root=root, python_roots=resolved_python_roots),
+                        workers=workers_resolved,
+                        cache_dir=extract_cache_dir,
+                        contents=contents,
+                    )
                 with ThreadPoolExecutor(max_workers=workers_resolved) as executor_bundle:
                     futures_bundle = [
                         executor_bundle.submit(
@@ -665,6 +733,9 @@ def pack(
                             python_roots=resolved_python_roots,
                             compress=compress,
                             line_numbers=line_numbers,
+                            extract_cache_dir=extract_cache_dir,
+                            extracted=extracted_bundle,
+                            data=contents.pop(f.absolute_path, None),
                         )
                         for f in selected_file_paths
                     ]
@@ -687,7 +758,7 @@ def pack(
 
     token_counts = (
         TokenCounts(
-            per_file_content_tokens=hybrid_per_file_tokens,
+            per_file_content_tokens=MappingProxyType(hybrid_per_file_tokens),
             content_total_tokens=sum(hybrid_per_file_tokens.values()),
         )
         if mode is PackMode.HYBRID
@@ -767,6 +838,7 @@ def pack(
                 (summary_config or SummaryConfig()).model_dump(mode="json") if mode is PackMode.HYBRID else None
             ),
             fit_to_max_output=fit_to_max_output if mode is PackMode.HYBRID else False,
+            extract_cache_dir=extract_cache_dir,
         )
         return PackResult(
             artifacts=artifacts,
@@ -828,9 +900,15 @@ def pack(
     )
 
 
-def _read_text(path: Path) -> str:
+def _read_text(path: Path, *, content: bytes | None = None) -> str:
     try:
-        return path.read_text(encoding="utf-8")
+        if content is None:
+            return path.read_text(encoding="utf-8")
+        # Same result as `read_text`, including its universal-newline translation.
+        text = content.decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
     except UnicodeDecodeError as e:
         raise ValueError(f"Non-UTF-8 text file cannot be packed: {path}") from e
     except OSError as e:
@@ -887,6 +965,21 @@ def _python_module_name_for_path(path: Path, root: Path, *, python_roots: list[P
     return abs_path.stem
 
 
+def _python_extract_tasks(
+    files: list[DiscoveredPath], *, root: Path, python_roots: list[Path]
+) -> list[tuple[Path, str, str]]:
+    # Tasks for `extract_many`, which parses these in worker processes before the per-file thread pool runs.
+    return [
+        (
+            f.absolute_path,
+            _python_module_name_for_path(f.absolute_path, root, python_roots=python_roots),
+            f.relative_posix,
+        )
+        for f in files
+        if not f.is_binary and f.absolute_path.suffix == ".py"
+    ]
+
+
 def _add_line_numbers(text: str) -> str:
     lines = text.splitlines(keepends=False)
     width = max(1, len(str(len(lines) if lines else 1)))
@@ -1184,7 +1277,7 @@ def _write_selection_report(
 
     ignore_rules = [
         {
-            "pattern": r.pattern + ("/" if r.directory_only else ""),
+            "pattern": r.display_pattern,
             "negated": r.negated,
             "anchored": r.anchored,
             "directory_only": r.directory_only,
@@ -1245,6 +1338,7 @@ def _write_jsonl(
     representation_rules: dict[str, list[str]] | None,
     summary_config: dict[str, Any] | None,
     fit_to_max_output: bool,
+    extract_cache_dir: Path | None = None,
 ) -> list[PackArtifact]:
     if files is None:
         files = _jsonl_files_from_payload(payload, token_encoding=token_encoding, size_by_rel=size_by_rel)
@@ -1529,7 +1623,9 @@ def _write_jsonl(
                             root_dir,
                             python_roots=_default_python_roots(root_dir),
                         )
-                        summ = python_summary(abs_path, module_name=module_name, relative_path=f.path)
+                        summ = python_summary(
+                            abs_path, module_name=module_name, relative_path=f.path, cache_dir=extract_cache_dir
+                        )
                         updated.append(
                             replace(
                                 f,
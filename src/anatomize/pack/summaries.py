@@ -4,16 +4,27 @@ from __future__ import annotations
 
 import json
 import re
-from collections import deque
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-import tomli
 import yaml
 from pydantic import BaseModel, Field
 
-from anatomize.core.extractor import SymbolExtractor
-from anatomize.core.types import ResolutionLevel
+from anatomize.pack.extract_cache import extract_module_cached
+from anatomize.pack.fileio import read_file_text
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+# libyaml-backed loader when PyYAML was built with it (the default for wheels); same safe subset either way.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 class SummaryConfig(BaseModel):
@@ -39,7 +50,14 @@ class SummaryConfig(BaseModel):
     model_config = {"frozen": True, "extra": "forbid"}
 
 
-def python_summary(path: Path, *, module_name: str, relative_path: str) -> dict[str, Any]:
+def python_summary(
+    path: Path,
+    *,
+    module_name: str,
+    relative_path: str,
+    cache_dir: Path | None = None,
+    content: bytes | None = None,
+) -> dict[str, Any]:
     """Generate a structural summary of a Python module.
 
     Parameters
@@ -50,14 +68,19 @@ def python_summary(path: Path, *, module_name: str, relative_path: str) -> dict[
         Fully qualified module name (e.g., 'pkg.sub.module').
     relative_path
         Path relative to the source root (POSIX style).
+    cache_dir
+        Optional directory for persistent extraction cache entries.
+    content
+        Already-read file bytes (skips reading `path` when provided).
 
     Returns
     -------
     dict[str, Any]
         Module info as a JSON-serializable dictionary.
     """
-    extractor = SymbolExtractor(resolution=ResolutionLevel.SIGNATURES)
-    info = extractor.extract_module(path, module_name, relative_path=relative_path, source=0)
+    info = extract_module_cached(
+        path, module_name=module_name, relative_path=relative_path, cache_dir=cache_dir, content=content
+    )
     return info.model_dump(mode="json")
 
 
@@ -110,7 +133,7 @@ def yaml_summary(text: str, *, cfg: SummaryConfig) -> dict[str, Any]:
         If the YAML cannot be parsed.
     """
     try:
-        obj = yaml.safe_load(text)
+        obj = yaml.load(text, Loader=_YamlLoader)
     except Exception as e:
         raise ValueError("Failed to parse YAML for summary") from e
     paths = _outline_paths(obj, max_depth=cfg.max_depth, max_items=cfg.max_items, max_keys=cfg.max_keys)
@@ -138,14 +161,20 @@ def toml_summary(text: str, *, cfg: SummaryConfig) -> dict[str, Any]:
         If the TOML cannot be parsed.
     """
     try:
-        obj = tomli.loads(text)
+        obj = tomllib.loads(text)
     except Exception as e:
         raise ValueError("Failed to parse TOML for summary") from e
     paths = _outline_paths(obj, max_depth=cfg.max_depth, max_items=cfg.max_items, max_keys=cfg.max_keys)
     return {"type": "toml", "paths": paths}
 
 
-_MD_HEADING = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<text>.+?)\s*$")
+# Line boundaries recognized by str.splitlines(); a heading never spans one. The pattern starts with a
+# literal "#" (checked against the preceding character) so finditer can skip ahead between candidates.
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_MD_HEADING = re.compile(
+    rf"(?P<hashes>#(?<![^{_LINE_BREAKS}]#)#{{0,5}})[^\S{_LINE_BREAKS}]+"
+    rf"(?P<text>[^{_LINE_BREAKS}]+?)[^\S{_LINE_BREAKS}]*(?=[{_LINE_BREAKS}]|\Z)"
+)
 
 
 def markdown_summary(text: str, *, cfg: SummaryConfig) -> dict[str, Any]:
@@ -166,10 +195,7 @@ def markdown_summary(text: str, *, cfg: SummaryConfig) -> dict[str, Any]:
         Summary with type='markdown' and list of headings with level and text.
     """
     headings: list[dict[str, Any]] = []
-    for line in text.splitlines():
-        m = _MD_HEADING.match(line)
-        if not m:
-            continue
+    for m in _MD_HEADING.finditer(text):
         level = len(m.group("hashes"))
         headings.append({"level": level, "text": m.group("text")})
         if len(headings) >= cfg.max_headings:
@@ -215,7 +241,9 @@ def summary_for_text(*, suffix: str, text: str, rel_posix: str, cfg: SummaryConf
     raise ValueError(f"Unsupported summary type for {rel_posix}")
 
 
-def summary_for_path(path: Path, *, rel_posix: str, cfg: SummaryConfig) -> dict[str, Any]:
+def summary_for_path(
+    path: Path, *, rel_posix: str, cfg: SummaryConfig, content: bytes | None = None
+) -> dict[str, Any]:
     """Generate a summary for a file by reading and analyzing its content.
 
     Parameters
@@ -226,6 +254,8 @@ def summary_for_path(path: Path, *, rel_posix: str, cfg: SummaryConfig) -> dict[
         Relative path for error messages.
     cfg
         Summary configuration limits.
+    content
+        Already-read file bytes (skips reading `path` when provided).
 
     Returns
     -------
@@ -237,38 +267,51 @@ def summary_for_path(path: Path, *, rel_posix: str, cfg: SummaryConfig) -> dict[
     ValueError
         If the file type is not supported for summarization.
     """
-    text = path.read_text(encoding="utf-8")
+    text = read_file_text(path) if content is None else content.decode("utf-8")
     return summary_for_text(suffix=path.suffix, text=text, rel_posix=rel_posix, cfg=cfg)
 
 
 def _outline_paths(obj: Any, *, max_depth: int, max_items: int, max_keys: int) -> list[str]:
     paths: list[str] = []
-    queue: deque[tuple[str, Any, int]] = deque([("", obj, 0)])
+    # Breadth-first so truncation keeps the shallowest paths. A list with a read index is cheaper than a
+    # deque here, and stays small: at most one entry per emitted path.
+    pending: list[tuple[str, Any, int]] = [("", obj, 0)]
+    head = 0
     key_count = 0
     item_count = 0
 
-    while queue:
-        prefix, cur, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
+    while head < len(pending):
+        prefix, cur, depth = pending[head]
+        head += 1
+        # Children at the depth limit are emitted but never expanded, so don't queue them.
+        expand = depth + 1 < max_depth
 
         if isinstance(cur, dict):
-            for k in sorted(cur.keys(), key=lambda x: str(x)):
+            if len(cur) <= 1:
+                keys: Iterable[Any] = cur.keys()
+            elif all(type(k) is str for k in cur):
+                # Plain string keys (always for JSON/TOML): natural order equals `str` order, without a key call.
+                keys = sorted(cur)
+            else:
+                keys = sorted(cur, key=str)
+            for k in keys:
                 if key_count >= max_keys or item_count >= max_items:
                     return paths
                 key_count += 1
                 item_count += 1
                 p = f"{prefix}.{k}" if prefix else str(k)
                 paths.append(p)
-                queue.append((p, cur[k], depth + 1))
+                if expand:
+                    pending.append((p, cur[k], depth + 1))
         elif isinstance(cur, list):
             # Only expand the first few items deterministically.
-            for i, v in enumerate(cur[: min(len(cur), 10)]):
+            for i, v in enumerate(cur[:10]):
                 if item_count >= max_items:
                     return paths
                 item_count += 1
                 p = f"{prefix}[{i}]" if prefix else f"[{i}]"
                 paths.append(p)
-                queue.append((p, v, depth + 1))
+                if expand:
+                    pending.append((p, v, depth + 1))
 
     return paths
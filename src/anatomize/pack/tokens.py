@@ -1,12 +1,44 @@
-"""Token counting for pack output."""
+"""Token counting for pack output.
+
+Per-file counts are memoized in a bounded in-memory LRU keyed by encoding name
+and a content digest, so duplicate files (and files unchanged between `pack`
+runs in the same process) are only tokenized once.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from functools import cache
+from itertools import repeat
+from types import MappingProxyType
 
 import tiktoken
 
+# tiktoken's core encoder releases the GIL, so payloads are counted on threads over size-balanced chunks.
+_MAX_THREADS = 8
+# Only payloads at least this large (in characters) are sharded across worker processes instead; below it, threads
+# beat starting workers that each load the encoding and unpickle the text.
+_PROCESS_POOL_MIN_CHARS = 100 * 1024 * 1024
+# Texts are sent to worker processes in windows of about this many characters, so only a few pickled windows
+# (not the whole payload) are in flight at once.
+_PROCESS_WINDOW_CHARS = 8 * 1024 * 1024
+
+# Loaded encodings by name. Lookups are plain dict reads; a racing first load just builds the same encoding twice.
+_ENCODINGS: dict[str, tiktoken.Encoding] = {}
+# Per-encoding `encode_ordinary` of tiktoken's Rust core, skipping the Python wrapper (see `_ordinary_encoder`).
+_ORDINARY_ENCODERS: dict[str, Callable[[str], list[int]]] = {}
+
+_MAX_COUNT_CACHE_ENTRIES = 65536
+
+_count_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_count_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class TokenCounts:
@@ -15,18 +47,25 @@ class TokenCounts:
     Attributes
     ----------
     per_file_content_tokens
-        Map of relative path to token count.
+        Read-only map of relative path to token count.
     content_total_tokens
         Total tokens across all files.
     """
 
-    per_file_content_tokens: dict[str, int]
+    per_file_content_tokens: Mapping[str, int]
     content_total_tokens: int
 
 
 def count_tokens(text: str, *, encoding_name: str) -> int:
-    """Count tokens in text using the specified encoding."""
-    return len(_encoding(encoding_name).encode(text))
+    """Count tokens in text using the specified encoding (special-token text counts as ordinary text)."""
+    if not text:
+        return 0
+    encode = _ORDINARY_ENCODERS.get(encoding_name) or _ordinary_encoder(encoding_name)
+    try:
+        return len(encode(text))
+    except UnicodeEncodeError:
+        # Lone surrogates: the public encoder replaces them before retrying.
+        return len(_ENCODINGS[encoding_name].encode_ordinary(text))
 
 
 def count_content_tokens_by_path(payload_by_path: dict[str, str], *, encoding_name: str) -> TokenCounts:
@@ -44,16 +83,116 @@ def count_content_tokens_by_path(payload_by_path: dict[str, str], *, encoding_na
     TokenCounts
         Per-file and total token counts.
     """
-    encoding = _encoding(encoding_name)
-    per_file: dict[str, int] = {}
-    total = 0
-    for path in sorted(payload_by_path.keys()):
-        tokens = len(encoding.encode(payload_by_path[path]))
-        per_file[path] = tokens
-        total += tokens
-    return TokenCounts(per_file_content_tokens=per_file, content_total_tokens=total)
-
-
-@cache
-def _encoding(name: str) -> tiktoken.Encoding:
-    return tiktoken.get_encoding(name)
+    # Results follow the payload's own order; consumers that render counts (`render_token_tree`) sort paths.
+    # Empty files (`__init__.py`, `py.typed`) count 0 without being hashed or encoded.
+    keys = {path: (encoding_name, _digest(text)) for path, text in payload_by_path.items() if text}
+    known = _cached_counts(list(keys.values()))
+    # Identical content is encoded once, however many paths share it.
+    misses: dict[tuple[str, bytes], str] = {}
+    for path, key in keys.items():
+        if key not in known and key not in misses:
+            misses[key] = payload_by_path[path]
+    if misses:
+        counts = _count_texts(list(misses.values()), encoding_name=encoding_name)
+        fresh = dict(zip(misses, counts))
+        _store_counts(fresh)
+        known.update(fresh)
+    per_file = {path: known[keys[path]] if path in keys else 0 for path in payload_by_path}
+    # A read-only view shares the dict instead of copying it into the frozen result.
+    return TokenCounts(per_file_content_tokens=MappingProxyType(per_file), content_total_tokens=sum(per_file.values()))
+
+
+def clear_token_cache() -> None:
+    """Drop all memoized per-file token counts."""
+    with _count_lock:
+        _count_cache.clear()
+
+
+def _count_texts(texts: list[str], *, encoding_name: str) -> list[int]:
+    cpus = os.cpu_count() or 1
+    counts: list[int] | None = None
+    if cpus > 1 and len(texts) > 1 and sum(map(len, texts)) >= _PROCESS_POOL_MIN_CHARS:
+        counts = _count_in_processes(texts, encoding_name=encoding_name, workers=cpus)
+    if counts is None:
+        counts = _count_in_threads(texts, encoding_name=encoding_name, workers=min(_MAX_THREADS, cpus))
+    return counts
+
+
+def _digest(text: str) -> bytes:
+    # `surrogatepass` keeps lone surrogates (possible in decoded file text) hashable without collisions.
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _cached_counts(keys: list[tuple[str, bytes]]) -> dict[tuple[str, bytes], int]:
+    found: dict[tuple[str, bytes], int] = {}
+    with _count_lock:
+        for key in keys:
+            count = _count_cache.get(key)
+            if count is not None:
+                _count_cache.move_to_end(key)
+                found[key] = count
+    return found
+
+
+def _store_counts(counts: dict[tuple[str, bytes], int]) -> None:
+    with _count_lock:
+        _count_cache.update(counts)
+        while len(_count_cache) > _MAX_COUNT_CACHE_ENTRIES:
+            _count_cache.popitem(last=False)
+
+
+def _count_in_threads(texts: list[str], *, encoding_name: str, workers: int) -> list[int]:
+    if workers <= 1 or len(texts) <= 1:
+        return _count_chunk(texts, encoding_name)
+    chunks = _balanced_chunks(texts, workers)
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        results = list(pool.map(_count_chunk, chunks, repeat(encoding_name)))
+    return [n for chunk in results for n in chunk]
+
+
+def _count_in_processes(texts: list[str], *, encoding_name: str, workers: int) -> list[int] | None:
+    windows = max(workers, -(-sum(map(len, texts)) // _PROCESS_WINDOW_CHARS))
+    chunks = _balanced_chunks(texts, windows)
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_count_chunk, chunks, repeat(encoding_name)))
+    except (OSError, BrokenProcessPool):
+        # No usable process support (e.g. restricted sandboxes): the caller counts on threads.
+        return None
+    return [n for chunk in results for n in chunk]
+
+
+def _balanced_chunks(texts: list[str], parts: int) -> list[list[str]]:
+    # Contiguous chunks (so results stay in input order) of roughly equal total length, not equal file count:
+    # one large file should not leave the other workers idle.
+    target = max(1, -(-sum(map(len, texts)) // parts))
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for text in texts:
+        current.append(text)
+        size += len(text)
+        if size >= target and len(chunks) < parts - 1:
+            chunks.append(current)
+            current, size = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _count_chunk(texts: list[str], encoding_name: str) -> list[int]:
+    # Only the lengths are kept; token lists are dropped as soon as they are counted.
+    encode = _ORDINARY_ENCODERS.get(encoding_name) or _ordinary_encoder(encoding_name)
+    try:
+        return [len(encode(text)) for text in texts]
+    except UnicodeEncodeError:
+        # Rare (lone surrogates): recount the chunk text by text so `count_tokens` can retry just that one.
+        return [count_tokens(text, encoding_name=encoding_name) for text in texts]
+
+
+def _ordinary_encoder(name: str) -> Callable[[str], list[int]]:
+    enc = _ENCODINGS.get(name) or _ENCODINGS.setdefault(name, tiktoken.get_encoding(name))
+    # `Encoding._core_bpe` is private; fall back to the public method if a tiktoken release drops it.
+    core = getattr(enc, "_core_bpe", None)
+    encode: Callable[[str], list[int]] = getattr(core, "encode_ordinary", None) or enc.encode_ordinary
+    return _ORDINARY_ENCODERS.setdefault(name, encode)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TypeAlias, Union, cast
 
 StructureTree: TypeAlias = dict[str, Union[None, "StructureTree"]]
@@ -49,7 +50,7 @@ def render_structure_tree(paths: list[tuple[str, bool]]) -> list[str]:
     return lines
 
 
-def render_token_tree(tokens_by_path: dict[str, int]) -> list[str]:
+def render_token_tree(tokens_by_path: Mapping[str, int]) -> list[str]:
     """Render a tree view with token counts per file.
 
     Parameters
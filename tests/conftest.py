@@ -23,9 +23,9 @@ if TYPE_CHECKING:
     pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_skeleton() -> Skeleton:
-    """Create a minimal valid Skeleton for testing."""
+    """Create a minimal valid Skeleton for testing (shared; tests must not mutate it)."""
     return Skeleton(
         metadata=SkeletonMetadata(
             generator_version="0.2.0",
@@ -49,9 +49,9 @@ def minimal_skeleton() -> Skeleton:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skeleton_with_classes() -> Skeleton:
-    """Create a Skeleton with sample classes and functions."""
+    """Create a Skeleton with sample classes and functions (shared; tests must not mutate it)."""
     return Skeleton(
         metadata=SkeletonMetadata(
             generator_version="0.2.0",
@@ -8,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from anatomize.cli import app
+from anatomize.pack import extract_cache
 
 pytestmark = pytest.mark.e2e
 
@@ -76,3 +77,43 @@ def test_cli_pack_rejects_conflicting_format_and_output_extension(
     res = runner.invoke(app, ["pack", ".", "--format", "markdown", "--output", "out.jsonl", "--include", "src/**"])
     assert res.exit_code != 0
     assert "extension implies format jsonl" in res.output
+
+
+@pytest.mark.parametrize("from_config", [False, True])
+def test_cli_pack_extract_cache_is_reused_across_runs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, from_config: bool
+) -> None:
+    project = tmp_path / "project"
+    pkg = project / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "a.py").write_text("def f(x: int) -> int:\n    return x\n", encoding="utf-8")
+    if from_config:
+        (project / ".anatomize.yaml").write_text("pack:\n  extract_cache: .anatomy/cache\n", encoding="utf-8")
+
+    # Run from another directory: a relative cache path must resolve against ROOT, not the CWD.
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    runner = CliRunner()
+    args = ["pack", str(project), "--include", "src/**", "--compress"]
+    if not from_config:
+        args += ["--extract-cache", ".anatomy/cache"]
+
+    extract_cache.clear_extract_cache()
+    first = runner.invoke(app, [*args, "--output", str(tmp_path / "first.md")])
+    assert first.exit_code == 0, first.output
+    assert list((project / ".anatomy" / "cache").rglob("*.json"))
+    assert not (elsewhere / ".anatomy").exists()
+
+    # A fresh process would start with an empty memory cache; only the disk layer can satisfy the second run.
+    extract_cache.clear_extract_cache()
+
+    class _NoExtract:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            raise AssertionError("extractor should not run on a disk cache hit")
+
+    monkeypatch.setattr(extract_cache, "SymbolExtractor", _NoExtract)
+    second = runner.invoke(app, [*args, "--output", str(tmp_path / "second.md")])
+    assert second.exit_code == 0, second.output
+    assert (tmp_path / "second.md").read_text(encoding="utf-8") == (tmp_path / "first.md").read_text(encoding="utf-8")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from anatomize.core.types import AttributeInfo, ClassInfo, FunctionInfo, ModuleInfo
@@ -10,6 +12,18 @@ from anatomize.pack.compress import _render_class, _render_function, render_modu
 pytestmark = pytest.mark.unit
 
 
+def _function_lines(fn: FunctionInfo, *, indent: str = "") -> list[str]:
+    buf = io.StringIO()
+    _render_function(fn, indent=indent, out=buf)
+    return buf.getvalue().splitlines()
+
+
+def _class_lines(cls: ClassInfo) -> list[str]:
+    buf = io.StringIO()
+    _render_class(cls, out=buf)
+    return buf.getvalue().splitlines()
+
+
 class TestRenderModule:
     """Tests for render_module function."""
 
@@ -101,32 +115,32 @@ class TestRenderFunction:
     def test_basic_function(self) -> None:
         """Test basic function rendering."""
         fn = FunctionInfo(name="foo", line=1, signature="() -> None")
-        lines = _render_function(fn)
+        lines = _function_lines(fn)
         assert any("def foo() -> None: ..." in line for line in lines)
 
     def test_async_function(self) -> None:
         """Test async function rendering."""
         fn = FunctionInfo(name="bar", line=1, signature="() -> None", is_async=True)
-        lines = _render_function(fn)
+        lines = _function_lines(fn)
         assert any("async def bar() -> None: ..." in line for line in lines)
 
     def test_with_decorators(self) -> None:
         """Test function with decorators."""
         fn = FunctionInfo(name="baz", line=1, signature="() -> None", decorators=["staticmethod", "cached"])
-        lines = _render_function(fn)
+        lines = _function_lines(fn)
         assert any("@staticmethod" in line for line in lines)
         assert any("@cached" in line for line in lines)
 
     def test_with_indent(self) -> None:
         """Test function rendering with indent (for methods)."""
         fn = FunctionInfo(name="method", line=1, signature="(self) -> None")
-        lines = _render_function(fn, indent="    ")
+        lines = _function_lines(fn, indent="    ")
         assert any("    def method(self) -> None: ..." in line for line in lines)
 
     def test_decorator_ordering(self) -> None:
         """Test that decorators come before def."""
         fn = FunctionInfo(name="func", line=1, signature="() -> None", decorators=["deco"])
-        lines = _render_function(fn)
+        lines = _function_lines(fn)
         deco_idx = next(i for i, line in enumerate(lines) if "@deco" in line)
         def_idx = next(i for i, line in enumerate(lines) if "def func" in line)
         assert deco_idx < def_idx
@@ -138,25 +152,25 @@ class TestRenderClass:
     def test_basic_class(self) -> None:
         """Test basic class rendering."""
         cls = ClassInfo(name="Foo", line=1)
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         assert any("class Foo:" in line for line in lines)
 
     def test_with_bases(self) -> None:
         """Test class with base classes."""
         cls = ClassInfo(name="Foo", line=1, bases=["Bar", "Baz"])
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         assert any("class Foo(Bar, Baz):" in line for line in lines)
 
     def test_with_decorators(self) -> None:
         """Test class with decorators."""
         cls = ClassInfo(name="Foo", line=1, decorators=["dataclass"])
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         assert any("@dataclass" in line for line in lines)
 
     def test_empty_class_has_ellipsis(self) -> None:
         """Test that empty class body contains ellipsis."""
         cls = ClassInfo(name="Empty", line=1)
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         assert any("..." in line for line in lines)
 
     def test_with_attributes(self) -> None:
@@ -169,7 +183,7 @@ class TestRenderClass:
                 AttributeInfo(name="y", line=3, annotation="str", default='"default"'),
             ],
         )
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         joined = "\n".join(lines)
         assert "x: int" in joined
         assert 'y: str = "default"' in joined
@@ -181,7 +195,7 @@ class TestRenderClass:
             line=1,
             methods=[FunctionInfo(name="method", line=5, signature="(self) -> None")],
         )
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         joined = "\n".join(lines)
         assert "def method(self) -> None: ..." in joined
 
@@ -192,7 +206,7 @@ class TestRenderClass:
             line=1,
             methods=[FunctionInfo(name="method", line=5, signature="(self) -> None")],
         )
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         method_line = next(line for line in lines if "def method" in line)
         assert method_line.startswith("    ")
 
@@ -203,14 +217,14 @@ class TestRenderClass:
             line=1,
             attributes=[AttributeInfo(name="x", line=2, annotation="int")],
         )
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         attr_line = next(line for line in lines if "x: int" in line)
         assert attr_line.startswith("    ")
 
     def test_class_with_no_bases_no_parens(self) -> None:
         """Test that class with no bases has no parentheses."""
         cls = ClassInfo(name="Foo", line=1)
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         class_line = next(line for line in lines if "class Foo" in line)
         assert "class Foo:" in class_line
         assert "class Foo():" not in class_line
@@ -225,6 +239,6 @@ class TestRenderClass:
                 FunctionInfo(name="alpha", line=10, signature="(self) -> None"),
             ],
         )
-        lines = _render_class(cls)
+        lines = _class_lines(cls)
         joined = "\n".join(lines)
         assert joined.index("def alpha") < joined.index("def zebra")
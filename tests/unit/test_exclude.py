@@ -1,6 +1,6 @@
 import pytest
 
-from anatomize.core.exclude import Excluder
+from anatomize.core.exclude import Excluder, clear_glob_caches, compile_glob, parse_ignore_line
 
 pytestmark = pytest.mark.unit
 
@@ -43,3 +43,51 @@ def test_exclude_trailing_spaces_ignored_unless_escaped() -> None:
 def test_exclude_rejects_unsupported_backslash_escapes() -> None:
     with pytest.raises(ValueError, match="Unsupported backslash escape"):
         Excluder([r"src\\**"])
+
+
+def test_exclude_double_star_matches_zero_or_more_segments() -> None:
+    ex = Excluder(["docs/**/*.md"])
+    assert ex.is_excluded("docs/a.md", is_dir=False) is True
+    assert ex.is_excluded("docs/x/y/a.md", is_dir=False) is True
+    assert ex.is_excluded("src/docs/a.md", is_dir=False) is True
+    assert ex.is_excluded("docs/a.py", is_dir=False) is False
+
+
+def test_exclude_wildcards_do_not_cross_segments() -> None:
+    ex = Excluder(["src/*.py"])
+    assert ex.is_excluded("src/a.py", is_dir=False) is True
+    assert ex.is_excluded("src/pkg/a.py", is_dir=False) is False
+
+
+def test_explain_reports_last_matching_rule() -> None:
+    ex = Excluder([("*.py", "default"), ("!keep.py", "cli"), ("keep.py", ".gitignore")])
+    excluded, rule = ex.explain("pkg/keep.py", is_dir=False)
+    assert excluded is True
+    assert rule is not None
+    assert (rule.pattern, rule.source) == ("keep.py", ".gitignore")
+
+    excluded, rule = ex.explain("README.md", is_dir=False)
+    assert excluded is False
+    assert rule is None
+
+
+def test_display_pattern_is_built_once_per_rule() -> None:
+    ex = Excluder(["/build/", "*.log"])
+    assert [r.display_pattern for r in ex.rules()] == ["build/", "*.log"]
+    _, first = ex.explain("build", is_dir=True)
+    _, second = ex.explain("build", is_dir=True)
+    assert first is not None and second is not None
+    assert first.display_pattern is second.display_pattern
+
+
+def test_glob_and_parse_caches_are_shared_and_clearable() -> None:
+    assert compile_glob("*.py") is compile_glob("*.py")
+    assert parse_ignore_line("!a/", allow_negation=True) is parse_ignore_line("!a/", allow_negation=True)
+    # Invalid lines are never cached as successes.
+    for _ in range(2):
+        with pytest.raises(ValueError, match="backslash"):
+            parse_ignore_line("a\\b", allow_negation=True)
+
+    clear_glob_caches()
+    assert compile_glob("*.py").match("x.py") is not None
+    assert Excluder(["*.py"]).is_excluded("x.py", is_dir=False) is True
@@ -0,0 +1,81 @@
+"""Unit tests for the content-addressed extraction cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from anatomize.pack import extract_cache
+from anatomize.pack.extract_cache import clear_extract_cache, extract_many, extract_module_cached
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> None:
+    clear_extract_cache()
+
+
+def test_identical_content_keeps_per_path_identity(tmp_path: Path) -> None:
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("def f(x: int) -> int:\n    return x\n", encoding="utf-8")
+    b.write_text(a.read_text(encoding="utf-8"), encoding="utf-8")
+
+    info_a = extract_module_cached(a, module_name="a", relative_path="a.py")
+    info_b = extract_module_cached(b, module_name="b", relative_path="b.py")
+
+    assert (info_a.name, info_a.path) == ("a", "a.py")
+    assert (info_b.name, info_b.path) == ("b", "b.py")
+    assert [f.name for f in info_b.functions] == ["f"]
+
+
+def test_changed_content_is_re_extracted(tmp_path: Path) -> None:
+    p = tmp_path / "m.py"
+    p.write_text("def old() -> None: ...\n", encoding="utf-8")
+    assert [f.name for f in extract_module_cached(p, module_name="m", relative_path="m.py").functions] == ["old"]
+
+    p.write_text("def new() -> None: ...\n", encoding="utf-8")
+    assert [f.name for f in extract_module_cached(p, module_name="m", relative_path="m.py").functions] == ["new"]
+
+
+def test_disk_cache_skips_extraction(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    p = tmp_path / "m.py"
+    p.write_text("X: int = 1\n\nclass C:\n    pass\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = extract_module_cached(p, module_name="m", relative_path="m.py", cache_dir=cache_dir)
+    assert list(cache_dir.rglob("*.json"))
+
+    clear_extract_cache()
+
+    class _NoExtract:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            raise AssertionError("extractor should not run on a disk cache hit")
+
+    monkeypatch.setattr(extract_cache, "SymbolExtractor", _NoExtract)
+    second = extract_module_cached(p, module_name="m", relative_path="m.py", cache_dir=cache_dir)
+    assert second == first
+
+
+def test_extract_many_in_worker_processes_matches_single_extraction(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tasks: list[tuple[Path, str, str]] = []
+    for name, body in [("a", "def f() -> None: ...\n"), ("b", "class B:\n    x: int = 1\n"), ("c", "")]:
+        p = tmp_path / f"{name}.py"
+        p.write_text(body, encoding="utf-8")
+        tasks.append((p, name, f"{name}.py"))
+    broken = tmp_path / "broken.py"
+    broken.write_text("def (:\n", encoding="utf-8")
+    tasks.append((broken, "broken", "broken.py"))
+
+    monkeypatch.setattr(extract_cache, "_MIN_PROCESS_BATCH", 1)
+    result = extract_many(tasks, workers=2)
+
+    # Unparseable modules are left for the caller to report.
+    assert sorted(result) == ["a.py", "b.py", "c.py"]
+    clear_extract_cache()
+    for path, name, rel in tasks[:3]:
+        assert result[rel] == extract_module_cached(path, module_name=name, relative_path=rel)
@@ -30,37 +30,49 @@ def formatter() -> MarkdownFormatter:
     return MarkdownFormatter()
 
 
+@pytest.fixture(scope="class")
+def outdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one output directory per class; tests write into per-test subdirectories."""
+    return tmp_path_factory.mktemp("markdown_fmt")
+
+
+@pytest.fixture
+def out(outdir: Path, request: pytest.FixtureRequest) -> Path:
+    """Return this test's (not yet created) subdirectory of the class output directory."""
+    return outdir / request.node.name
+
+
 class TestMarkdownFormatterWrite:
     """Tests for MarkdownFormatter.write method."""
 
     def test_write_creates_hierarchy_file(
-        self, formatter: MarkdownFormatter, tmp_path: Path, minimal_skeleton: Skeleton
+        self, formatter: MarkdownFormatter, out: Path, minimal_skeleton: Skeleton
     ) -> None:
         """Test that write creates hierarchy.md file."""
-        formatter.write(minimal_skeleton, tmp_path)
-        assert (tmp_path / "hierarchy.md").exists()
+        formatter.write(minimal_skeleton, out)
+        assert (out / "hierarchy.md").exists()
 
     def test_write_creates_modules_directory(
-        self, formatter: MarkdownFormatter, tmp_path: Path, skeleton_with_classes: Skeleton
+        self, formatter: MarkdownFormatter, out: Path, skeleton_with_classes: Skeleton
     ) -> None:
         """Test that write creates modules directory when modules exist."""
-        formatter.write(skeleton_with_classes, tmp_path)
-        assert (tmp_path / "modules").exists()
-        assert (tmp_path / "modules").is_dir()
+        formatter.write(skeleton_with_classes, out)
+        assert (out / "modules").exists()
+        assert (out / "modules").is_dir()
 
     def test_write_creates_module_files(
-        self, formatter: MarkdownFormatter, tmp_path: Path, skeleton_with_classes: Skeleton
+        self, formatter: MarkdownFormatter, out: Path, skeleton_with_classes: Skeleton
     ) -> None:
         """Test that write creates package-named module files."""
-        formatter.write(skeleton_with_classes, tmp_path)
-        assert (tmp_path / "modules" / "pkg.md").exists()
+        formatter.write(skeleton_with_classes, out)
+        assert (out / "modules" / "pkg.md").exists()
 
     def test_hierarchy_file_contains_metadata(
-        self, formatter: MarkdownFormatter, tmp_path: Path, minimal_skeleton: Skeleton
+        self, formatter: MarkdownFormatter, out: Path, minimal_skeleton: Skeleton
     ) -> None:
         """Test that hierarchy file contains metadata."""
-        formatter.write(minimal_skeleton, tmp_path)
-        content = (tmp_path / "hierarchy.md").read_text()
+        formatter.write(minimal_skeleton, out)
+        content = (out / "hierarchy.md").read_text()
         assert "Anatomize" in content or "Package Hierarchy" in content
         assert "Modules" in content or "modules" in content.lower()
 
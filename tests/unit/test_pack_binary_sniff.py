@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
-from anatomize.pack.discovery import _is_binary_file
+from anatomize.core.exclude import Excluder
+from anatomize.core.policy import SymlinkPolicy
+from anatomize.pack import discovery, fileio
+from anatomize.pack.discovery import DiscoveredPath, _is_binary_prefix, _sniff_file, discover_paths
 
 pytestmark = pytest.mark.unit
 
@@ -14,34 +18,119 @@ def test_binary_sniff_reads_only_prefix(monkeypatch: pytest.MonkeyPatch, tmp_pat
     p.write_text("a" * 50_000, encoding="utf-8")
 
     read_sizes: list[int] = []
-    orig_open = Path.open
+    orig_read = os.read
 
-    def open_wrapper(self: Path, mode: str = "r", *args: object, **kwargs: object):  # type: ignore[no-untyped-def]
-        f = orig_open(self, mode, *args, **kwargs)
-        if self == p and "b" in mode:
+    def read_wrapper(fd: int, n: int) -> bytes:
+        read_sizes.append(n)
+        return orig_read(fd, n)
 
-            class _Wrapped:
-                def __init__(self, inner):  # type: ignore[no-untyped-def]
-                    self._inner = inner
+    monkeypatch.setattr(fileio.os, "read", read_wrapper)
 
-                def read(self, n: int = -1) -> bytes:
-                    read_sizes.append(n)
-                    return self._inner.read(n)
+    assert _sniff_file(p, size=50_000, keep=False, sniff_bytes=8) == (False, None)
+    assert read_sizes == [8]
 
-                def __enter__(self):  # type: ignore[no-untyped-def]
-                    self._inner.__enter__()
-                    return self
 
-                def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
-                    return self._inner.__exit__(exc_type, exc, tb)
+def test_read_file_bytes_reads_whole_file(tmp_path: Path) -> None:
+    p = tmp_path / "data.txt"
+    p.write_bytes(b"line1\r\nline2\n" * 10_000)
+    assert fileio.read_file_bytes(p) == p.read_bytes()
+    assert fileio.read_file_bytes(p, limit=5) == b"line1"
+    assert fileio.read_file_text(p) == "line1\r\nline2\n" * 10_000
 
-                def __getattr__(self, name: str):  # type: ignore[no-untyped-def]
-                    return getattr(self._inner, name)
 
-            return _Wrapped(f)
-        return f
+def test_read_file_bytes_empty_file(tmp_path: Path) -> None:
+    p = tmp_path / "empty.txt"
+    p.write_bytes(b"")
+    assert fileio.read_file_bytes(p) == b""
 
-    monkeypatch.setattr(Path, "open", open_wrapper)
 
-    _is_binary_file(p, sniff_bytes=8)
-    assert read_sizes == [8]
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b"plain ascii\n\tindented\r\n\x0cpage\x1b[0m\n", False),
+        ("héllo wörld\n".encode(), False),
+        (b"a\x00b", True),
+        (b"a\x01b", True),
+        ("héllo".encode("latin-1"), True),
+        (b"", False),
+    ],
+)
+def test_binary_sniff_classification(data: bytes, expected: bool) -> None:
+    assert _is_binary_prefix(data, complete=True) is expected
+
+
+def test_binary_sniff_tolerates_utf8_split_at_prefix_boundary() -> None:
+    data = b"a" * 7 + "é".encode()
+    assert _is_binary_prefix(data[:8], complete=False) is False
+    assert _is_binary_prefix(data[:8], complete=True) is True
+
+
+@pytest.mark.parametrize("keep", [True, False])
+def test_sniff_file_returns_text_bytes_only_when_kept(tmp_path: Path, keep: bool) -> None:
+    short = tmp_path / "short.txt"
+    short.write_bytes(b"hello\r\n")
+    long = tmp_path / "long.txt"
+    long.write_bytes(b"x" * 20_000)
+    binary = tmp_path / "bin.dat"
+    binary.write_bytes(b"\x00\x01")
+
+    assert _sniff_file(short, size=7, keep=keep) == (False, b"hello\r\n" if keep else None)
+    assert _sniff_file(long, size=20_000, keep=keep) == (False, b"x" * 20_000 if keep else None)
+    assert _sniff_file(binary, size=2, keep=keep) == (True, None)
+
+
+def test_sniff_file_keeps_bytes_only_under_size_cap(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(discovery, "_KEEP_CONTENT_BYTES", 10)
+    at_cap = tmp_path / "at_cap.txt"
+    at_cap.write_bytes(b"a" * 10)
+    over_cap = tmp_path / "over_cap.txt"
+    over_cap.write_bytes(b"a" * 11)
+
+    assert _sniff_file(at_cap, size=10, keep=True) == (False, b"a" * 10)
+    assert _sniff_file(over_cap, size=11, keep=True) == (False, None)
+
+
+def test_discovery_collects_small_text_content_only_when_requested(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_bytes(b"hello\r\n")
+    (tmp_path / "long.txt").write_bytes(b"x" * 20_000)
+    (tmp_path / "bin.dat").write_bytes(b"\x00\x01")
+
+    def discover(contents: dict[Path, bytes] | None) -> list[DiscoveredPath]:
+        return discover_paths(
+            tmp_path,
+            excluder=Excluder([]),
+            include_patterns=None,
+            symlinks=SymlinkPolicy.FORBID,
+            max_file_bytes=0,
+            contents=contents,
+        )
+
+    contents: dict[Path, bytes] = {}
+    found = discover(contents)
+    assert found == discover(None)
+    root = tmp_path.resolve()
+    assert contents == {root / "a.txt": b"hello\r\n", root / "long.txt": b"x" * 20_000}
+
+
+def test_discovery_reads_only_prefix_of_binary_files(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "big.bin").write_bytes(b"\x00" * 100_000)
+
+    read_sizes: list[int] = []
+    orig_read = os.read
+
+    def read_wrapper(fd: int, n: int) -> bytes:
+        read_sizes.append(n)
+        return orig_read(fd, n)
+
+    monkeypatch.setattr(fileio.os, "read", read_wrapper)
+    contents: dict[Path, bytes] = {}
+    discover_paths(
+        tmp_path,
+        excluder=Excluder([]),
+        include_patterns=None,
+        symlinks=SymlinkPolicy.FORBID,
+        max_file_bytes=0,
+        contents=contents,
+    )
+    assert read_sizes == [8192]
+    assert contents == {}
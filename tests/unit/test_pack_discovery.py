@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
+from anatomize.core.exclude import Excluder
 from anatomize.core.policy import SymlinkPolicy
+from anatomize.pack.discovery import DiscoveryTraceItem, discover_paths
 from anatomize.pack.formats import PackFormat
 from anatomize.pack.runner import pack
 
@@ -97,3 +99,30 @@ def test_pack_default_ignores_exclude_runtime_and_logs(tmp_path: Path) -> None:
     paths = {f["path"] for f in data["files"]}
     assert "kept.txt" in paths
     assert ".runtime/index.log" not in paths
+
+
+def test_trace_records_directories_pruned_by_include_patterns(tmp_path: Path) -> None:
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "a.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "docs" / "deep").mkdir(parents=True)
+    (tmp_path / "docs" / "deep" / "b.md").write_text("# b\n", encoding="utf-8")
+    (tmp_path / "top.txt").write_text("t\n", encoding="utf-8")
+
+    trace: list[DiscoveryTraceItem] = []
+    found = discover_paths(
+        tmp_path,
+        excluder=Excluder([]),
+        include_patterns=["/src/**"],
+        symlinks=SymlinkPolicy.FORBID,
+        max_file_bytes=0,
+        trace=trace,
+    )
+
+    assert [d.relative_posix for d in found if not d.is_dir] == ["src/pkg/a.py"]
+    excluded = {t.path: t for t in trace if t.decision == "excluded"}
+    # The unreachable directory is reported once with reason "include"; nothing below it is walked.
+    assert excluded["docs"] == DiscoveryTraceItem(
+        path="docs", is_dir=True, decision="excluded", reason="include", matched_pattern=None, matched_source=None
+    )
+    assert not any(path.startswith("docs/") for path in excluded)
+    assert excluded["top.txt"].reason == "include"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from anatomize.pack.match import GlobMatcher
+
+pytestmark = pytest.mark.unit
+
+
+def test_could_match_under_uses_anchored_literal_prefix() -> None:
+    m = GlobMatcher(["/src/pkg/*.py", "/docs/"])
+    assert m.could_match_under("src") is True
+    assert m.could_match_under("src/pkg") is True
+    assert m.could_match_under("src/pkg/sub") is True
+    assert m.could_match_under("docs/api") is True
+    assert m.could_match_under("tests") is False
+    assert m.could_match_under("srcx") is False
+    assert m.could_match_under("src/other") is False
+
+
+def test_could_match_under_is_conservative_for_unanchored_patterns() -> None:
+    assert GlobMatcher(["*.py"]).could_match_under("anything/deep") is True
+    assert GlobMatcher(["pkg/*.py"]).could_match_under("vendor") is True
+    assert GlobMatcher(["/src/**", "tests/"]).could_match_under("other") is True
+
+
+def test_could_match_under_stops_at_first_wildcard() -> None:
+    m = GlobMatcher(["/src/pk*/mod.py"])
+    assert m.could_match_under("src/pkg") is True
+    assert m.could_match_under("src/other") is False
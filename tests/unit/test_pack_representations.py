@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from anatomize.pack.representations import FileRepresentation, RepresentationPolicy, compile_representation_rules
+
+pytestmark = pytest.mark.unit
+
+
+def _policy(
+    *, meta: list[str] | None = None, summary: list[str] | None = None, content: list[str] | None = None
+) -> RepresentationPolicy:
+    rules = []
+    rules.extend(compile_representation_rules(meta or [], FileRepresentation.META))
+    rules.extend(compile_representation_rules(summary or [], FileRepresentation.SUMMARY))
+    rules.extend(compile_representation_rules(content or [], FileRepresentation.CONTENT))
+    return RepresentationPolicy(rules=rules)
+
+
+def _resolve(policy: RepresentationPolicy, rel: str) -> FileRepresentation:
+    return policy.resolve(rel, is_dir=False, default=FileRepresentation.META)
+
+
+def test_last_matching_rule_wins() -> None:
+    policy = _policy(summary=["*.py"], content=["src/app.py"])
+    assert _resolve(policy, "src/app.py") is FileRepresentation.CONTENT
+    assert _resolve(policy, "src/other.py") is FileRepresentation.SUMMARY
+    assert _resolve(policy, "README.md") is FileRepresentation.META
+
+
+def test_double_star_matches_zero_or_more_segments() -> None:
+    policy = _policy(content=["docs/**/*.md"])
+    assert _resolve(policy, "docs/a.md") is FileRepresentation.CONTENT
+    assert _resolve(policy, "docs/x/y/a.md") is FileRepresentation.CONTENT
+    assert _resolve(policy, "pkg/docs/a.md") is FileRepresentation.CONTENT
+    assert _resolve(policy, "docs/a.txt") is FileRepresentation.META
+
+
+def test_anchored_and_directory_only_rules() -> None:
+    policy = _policy(content=["/src/*.py", "fixtures/"])
+    assert _resolve(policy, "src/a.py") is FileRepresentation.CONTENT
+    assert _resolve(policy, "lib/src/a.py") is FileRepresentation.META
+    assert _resolve(policy, "src/pkg/a.py") is FileRepresentation.META
+    assert _resolve(policy, "tests/fixtures/data/x.json") is FileRepresentation.CONTENT
+    assert _resolve(policy, "fixtures") is FileRepresentation.META
+    assert policy.resolve("fixtures", is_dir=True, default=FileRepresentation.META) is FileRepresentation.CONTENT
+
+
+def test_literal_basename_rules_keep_rule_order() -> None:
+    policy = _policy(meta=["Makefile"], summary=["*"], content=["Dockerfile"])
+    assert _resolve(policy, "ci/Dockerfile") is FileRepresentation.CONTENT
+    assert _resolve(policy, "Makefile") is FileRepresentation.SUMMARY
+    assert _resolve(policy, "build/Makefile.in") is FileRepresentation.SUMMARY
+
+
+def test_anchored_rules_interleave_with_generic_rules_in_order() -> None:
+    policy = _policy(meta=["/src/gen/"], summary=["*.py"], content=["/src/*.py", "/docs/"])
+    assert _resolve(policy, "src/a.py") is FileRepresentation.CONTENT
+    assert _resolve(policy, "src/gen/a.py") is FileRepresentation.SUMMARY
+    assert _resolve(policy, "src/gen/a.txt") is FileRepresentation.META
+    assert _resolve(policy, "docs/x/a.py") is FileRepresentation.CONTENT
+    assert _resolve(policy, "lib/a.py") is FileRepresentation.SUMMARY
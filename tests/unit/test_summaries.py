@@ -16,10 +16,19 @@ from anatomize.pack.summaries import (
 
 pytestmark = pytest.mark.unit
 
+SIMPLE_JSON = '{"a": 1, "b": 2}'
+NESTED_JSON = '{"outer": {"inner": 1}}'
+ARRAY_JSON = '[{"a": 1}, {"b": 2}]'
+DEEP_JSON = '{"a": {"b": {"c": 1}}}'
 
-@pytest.fixture
+# Limit variants shared by tests (SummaryConfig is frozen, so instances are safe to reuse).
+CFG_DEPTH1 = SummaryConfig(max_depth=1)
+CFG_HEAD2 = SummaryConfig(max_headings=2)
+
+
+@pytest.fixture(scope="session")
 def default_config() -> SummaryConfig:
-    """Create default summary config."""
+    """Create default summary config (frozen, so one instance is shared)."""
     return SummaryConfig()
 
 
@@ -51,23 +60,20 @@ class TestJsonSummary:
 
     def test_simple_object(self, default_config: SummaryConfig) -> None:
         """Test summary of a simple JSON object."""
-        text = '{"a": 1, "b": 2}'
-        result = json_summary(text, cfg=default_config)
+        result = json_summary(SIMPLE_JSON, cfg=default_config)
         assert result["type"] == "json"
         assert "a" in result["paths"]
         assert "b" in result["paths"]
 
     def test_nested_object(self, default_config: SummaryConfig) -> None:
         """Test summary of nested JSON objects."""
-        text = '{"outer": {"inner": 1}}'
-        result = json_summary(text, cfg=default_config)
+        result = json_summary(NESTED_JSON, cfg=default_config)
         assert "outer" in result["paths"]
         assert "outer.inner" in result["paths"]
 
     def test_array_elements(self, default_config: SummaryConfig) -> None:
         """Test summary of JSON arrays."""
-        text = '[{"a": 1}, {"b": 2}]'
-        result = json_summary(text, cfg=default_config)
+        result = json_summary(ARRAY_JSON, cfg=default_config)
         assert "[0]" in result["paths"]
         assert "[0].a" in result["paths"]
         assert "[1]" in result["paths"]
@@ -80,9 +86,7 @@ class TestJsonSummary:
 
     def test_respects_max_depth(self) -> None:
         """Test that max_depth limits traversal."""
-        cfg = SummaryConfig(max_depth=1)
-        text = '{"a": {"b": {"c": 1}}}'
-        result = json_summary(text, cfg=cfg)
+        result = json_summary(DEEP_JSON, cfg=CFG_DEPTH1)
         assert "a" in result["paths"]
         assert "a.b" not in result["paths"]
 
@@ -172,9 +176,8 @@ class TestMarkdownSummary:
 
     def test_respects_max_headings(self) -> None:
         """Test that max_headings limits extraction."""
-        cfg = SummaryConfig(max_headings=2)
         text = "# H1\n## H2\n### H3\n#### H4"
-        result = markdown_summary(text, cfg=cfg)
+        result = markdown_summary(text, cfg=CFG_HEAD2)
         assert len(result["headings"]) == 2
 
     def test_no_headings(self, default_config: SummaryConfig) -> None:
@@ -191,34 +194,30 @@ class TestMarkdownSummary:
         assert len(result["headings"]) == 1
         assert result["headings"][0]["text"] == "Real heading"
 
+    def test_crlf_and_blank_headings(self, default_config: SummaryConfig) -> None:
+        """Test that headings never span lines and CRLF endings are stripped."""
+        text = "# Title \r\n#\nNot a heading\r\n##\tSub\rtext"
+        result = markdown_summary(text, cfg=default_config)
+        assert result["headings"] == [{"level": 1, "text": "Title"}, {"level": 2, "text": "Sub"}]
+
 
 class TestSummaryForText:
     """Tests for summary_for_text router function."""
 
-    def test_routes_json(self, default_config: SummaryConfig) -> None:
-        """Test routing to JSON summary."""
-        result = summary_for_text(suffix=".json", text="{}", rel_posix="test.json", cfg=default_config)
-        assert result["type"] == "json"
-
-    def test_routes_yaml(self, default_config: SummaryConfig) -> None:
-        """Test routing to YAML summary."""
-        result = summary_for_text(suffix=".yaml", text="key: 1", rel_posix="test.yaml", cfg=default_config)
-        assert result["type"] == "yaml"
-
-    def test_routes_yml(self, default_config: SummaryConfig) -> None:
-        """Test routing .yml extension to YAML summary."""
-        result = summary_for_text(suffix=".yml", text="key: 1", rel_posix="test.yml", cfg=default_config)
-        assert result["type"] == "yaml"
-
-    def test_routes_toml(self, default_config: SummaryConfig) -> None:
-        """Test routing to TOML summary."""
-        result = summary_for_text(suffix=".toml", text='key = "val"', rel_posix="test.toml", cfg=default_config)
-        assert result["type"] == "toml"
-
-    def test_routes_markdown(self, default_config: SummaryConfig) -> None:
-        """Test routing to Markdown summary."""
-        result = summary_for_text(suffix=".md", text="# H1", rel_posix="test.md", cfg=default_config)
-        assert result["type"] == "markdown"
+    @pytest.mark.parametrize(
+        ("suffix", "text", "expected"),
+        [
+            (".json", "{}", "json"),
+            (".yaml", "key: 1", "yaml"),
+            (".yml", "key: 1", "yaml"),
+            (".toml", 'key = "val"', "toml"),
+            (".md", "# H1", "markdown"),
+        ],
+    )
+    def test_routes_by_suffix(self, default_config: SummaryConfig, suffix: str, text: str, expected: str) -> None:
+        """Test routing each supported suffix (including .yml) to its summary type."""
+        result = summary_for_text(suffix=suffix, text=text, rel_posix=f"test{suffix}", cfg=default_config)
+        assert result["type"] == expected
 
     def test_unsupported_raises(self, default_config: SummaryConfig) -> None:
         """Test that unsupported suffix raises ValueError."""
@@ -229,49 +228,31 @@ class TestSummaryForText:
 class TestOutlinePaths:
     """Tests for _outline_paths helper function."""
 
-    def test_dict_keys(self) -> None:
-        """Test extraction of dictionary keys."""
-        paths = _outline_paths({"a": 1, "b": 2}, max_depth=3, max_items=100, max_keys=100)
-        assert paths == ["a", "b"]
-
-    def test_sorted_keys(self) -> None:
-        """Test that keys are sorted."""
-        paths = _outline_paths({"z": 1, "a": 2, "m": 3}, max_depth=3, max_items=100, max_keys=100)
-        assert paths == ["a", "m", "z"]
-
-    def test_max_keys_limit(self) -> None:
-        """Test max_keys constraint."""
-        obj = {f"key{i}": i for i in range(10)}
-        paths = _outline_paths(obj, max_depth=3, max_items=100, max_keys=3)
-        assert len(paths) == 3
-
-    def test_max_items_limit(self) -> None:
-        """Test max_items constraint."""
-        obj = {"a": [1, 2, 3, 4, 5]}
-        paths = _outline_paths(obj, max_depth=3, max_items=3, max_keys=100)
-        assert len(paths) == 3
-
-    def test_max_depth_limit(self) -> None:
-        """Test max_depth constraint."""
-        obj = {"a": {"b": {"c": {"d": 1}}}}
-        paths = _outline_paths(obj, max_depth=2, max_items=100, max_keys=100)
-        assert "a" in paths
-        assert "a.b" in paths
-        assert "a.b.c" not in paths
-
-    def test_list_indices(self) -> None:
-        """Test list index formatting."""
-        obj = [1, 2, 3]
-        paths = _outline_paths(obj, max_depth=3, max_items=100, max_keys=100)
-        assert "[0]" in paths
-        assert "[1]" in paths
-        assert "[2]" in paths
-
-    def test_nested_path_format(self) -> None:
-        """Test nested path formatting."""
-        obj = {"a": {"b": [{"c": 1}]}}
-        paths = _outline_paths(obj, max_depth=5, max_items=100, max_keys=100)
-        assert "a" in paths
-        assert "a.b" in paths
-        assert "a.b[0]" in paths
-        assert "a.b[0].c" in paths
+    @pytest.mark.parametrize(
+        ("obj", "limits", "expected"),
+        [
+            pytest.param({"a": 1, "b": 2}, (3, 100, 100), ["a", "b"], id="dict_keys"),
+            pytest.param({"z": 1, "a": 2, "m": 3}, (3, 100, 100), ["a", "m", "z"], id="sorted_keys"),
+            pytest.param({"a": {"b": {"c": {"d": 1}}}}, (2, 100, 100), ["a", "a.b"], id="max_depth"),
+            pytest.param([1, 2, 3], (3, 100, 100), ["[0]", "[1]", "[2]"], id="list_indices"),
+            pytest.param(
+                {"a": {"b": [{"c": 1}]}}, (5, 100, 100), ["a", "a.b", "a.b[0]", "a.b[0].c"], id="nested_path_format"
+            ),
+        ],
+    )
+    def test_paths(self, obj: object, limits: tuple[int, int, int], expected: list[str]) -> None:
+        """Test path formatting, key ordering, and depth limiting; limits are (max_depth, max_items, max_keys)."""
+        max_depth, max_items, max_keys = limits
+        assert _outline_paths(obj, max_depth=max_depth, max_items=max_items, max_keys=max_keys) == expected
+
+    @pytest.mark.parametrize(
+        ("obj", "limits", "count"),
+        [
+            pytest.param({f"key{i}": i for i in range(10)}, (3, 100, 3), 3, id="max_keys"),
+            pytest.param({"a": [1, 2, 3, 4, 5]}, (3, 3, 100), 3, id="max_items"),
+        ],
+    )
+    def test_limits_cap_path_count(self, obj: object, limits: tuple[int, int, int], count: int) -> None:
+        """Test that max_keys and max_items cap the number of paths; limits are (max_depth, max_items, max_keys)."""
+        max_depth, max_items, max_keys = limits
+        assert len(_outline_paths(obj, max_depth=max_depth, max_items=max_items, max_keys=max_keys)) == count
@@ -0,0 +1,199 @@
+"""Unit tests for per-file token counting."""
+
+from __future__ import annotations
+
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+import tiktoken
+
+from anatomize.pack import tokens
+from anatomize.pack.tokens import clear_token_cache, count_content_tokens_by_path, count_tokens
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> None:
+    clear_token_cache()
+
+
+def test_duplicate_and_repeated_content_is_encoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    encoded: list[str] = []
+    real_chunk = tokens._count_chunk
+
+    def _spy(texts: list[str], encoding_name: str) -> list[int]:
+        encoded.extend(texts)
+        return real_chunk(texts, encoding_name)
+
+    monkeypatch.setattr(tokens, "_count_chunk", _spy)
+    payload = {"b/__init__.py": "", "a/__init__.py": "", "x.py": "def f() -> None:\n    pass\n"}
+
+    first = count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+    second = count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+
+    assert encoded == ["def f() -> None:\n    pass\n"]
+    assert first == second
+    assert list(first.per_file_content_tokens) == list(payload)
+    assert first.per_file_content_tokens["x.py"] == count_tokens(payload["x.py"], encoding_name="cl100k_base")
+    assert first.per_file_content_tokens["a/__init__.py"] == 0
+    assert first.content_total_tokens == sum(first.per_file_content_tokens.values())
+
+
+@pytest.mark.parametrize(
+    ("texts", "parts"),
+    [
+        (["a" * 10, "b", "c" * 5, "d" * 30, "e"], 3),
+        (["x" * 100, "y", "z"], 2),
+        (["one", "two", "three"], 8),
+        (["only"], 4),
+    ],
+)
+def test_balanced_chunks_keep_order_and_cover_every_text(texts: list[str], parts: int) -> None:
+    chunks = tokens._balanced_chunks(texts, parts)
+    assert [t for chunk in chunks for t in chunk] == texts
+    assert 1 <= len(chunks) <= parts
+    assert all(chunks)
+
+
+def test_threaded_counts_match_per_text_counts_in_payload_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    chunk_sizes: list[int] = []
+    real_chunk = tokens._count_chunk
+
+    def _spy(texts: list[str], encoding_name: str) -> list[int]:
+        chunk_sizes.append(len(texts))
+        return real_chunk(texts, encoding_name)
+
+    monkeypatch.setattr(tokens, "_MAX_THREADS", 4)
+    monkeypatch.setattr(tokens.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(tokens, "_count_chunk", _spy)
+    payload = {f"z{i}.py" if i % 2 else f"a{i}.py": f"value_{i} = {i}\n" * (i + 1) for i in range(20)}
+    payload["empty.py"] = ""
+
+    result = count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+
+    expected = {p: count_tokens(t, encoding_name="cl100k_base") for p, t in payload.items()}
+    assert list(result.per_file_content_tokens.items()) == list(expected.items())
+    assert result.content_total_tokens == sum(expected.values())
+    assert len(chunk_sizes) > 1
+    assert sum(chunk_sizes) == len(payload) - 1
+
+
+def test_process_pool_counts_match_serial_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tokens, "_PROCESS_POOL_MIN_CHARS", 1)
+    monkeypatch.setattr(tokens, "_PROCESS_WINDOW_CHARS", 64)
+    monkeypatch.setattr(tokens.os, "cpu_count", lambda: 2)
+    texts = [f"def f{i}(x):\n    return x * {i}\n" * (i % 5 + 1) for i in range(12)]
+    serial = tokens._count_chunk(texts, "cl100k_base")
+
+    assert tokens._count_in_processes(texts, encoding_name="cl100k_base", workers=2) == serial
+
+    payload = {f"m{i}.py": t for i, t in enumerate(texts)}
+    result = count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+    assert list(result.per_file_content_tokens.values()) == serial
+
+
+class _UnavailablePool:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        raise OSError("no process support")
+
+
+class _BrokenPool:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __enter__(self) -> _BrokenPool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def map(self, *args: Any, **kwargs: Any) -> Any:
+        raise BrokenProcessPool("worker died")
+
+
+@pytest.mark.parametrize("pool_cls", [_UnavailablePool, _BrokenPool])
+def test_process_pool_failure_falls_back_to_threads(monkeypatch: pytest.MonkeyPatch, pool_cls: type) -> None:
+    monkeypatch.setattr(tokens, "_PROCESS_POOL_MIN_CHARS", 1)
+    monkeypatch.setattr(tokens.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(tokens, "ProcessPoolExecutor", pool_cls)
+    thread_calls: list[int] = []
+    real_threads = tokens._count_in_threads
+
+    def _spy(texts: list[str], *, encoding_name: str, workers: int) -> list[int]:
+        thread_calls.append(len(texts))
+        return real_threads(texts, encoding_name=encoding_name, workers=workers)
+
+    monkeypatch.setattr(tokens, "_count_in_threads", _spy)
+    texts = ["alpha beta\n", "gamma\n" * 3, "delta epsilon zeta\n"]
+
+    assert tokens._count_in_processes(texts, encoding_name="cl100k_base", workers=2) is None
+    result = count_content_tokens_by_path({f"f{i}": t for i, t in enumerate(texts)}, encoding_name="cl100k_base")
+
+    assert list(result.per_file_content_tokens.values()) == tokens._count_chunk(texts, "cl100k_base")
+    assert thread_calls == [len(texts)]
+
+
+@pytest.fixture
+def encoded(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every text that reaches the encoder (cache misses)."""
+    seen: list[str] = []
+    real_chunk = tokens._count_chunk
+
+    def _spy(texts: list[str], encoding_name: str) -> list[int]:
+        seen.extend(texts)
+        return real_chunk(texts, encoding_name)
+
+    monkeypatch.setattr(tokens, "_count_chunk", _spy)
+    return seen
+
+
+def test_lone_surrogates_are_counted_like_the_public_encoder() -> None:
+    text = "ab\ud800cd"
+    expected = len(tiktoken.get_encoding("cl100k_base").encode_ordinary(text))
+
+    assert count_tokens(text, encoding_name="cl100k_base") == expected
+    # Inside a batch, the chunk holding it falls back to counting its texts one by one.
+    payload = {"ok.txt": "plain words\n", "bad.txt": text, "also_ok.txt": "more words\n"}
+    result = count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+    assert dict(result.per_file_content_tokens) == {
+        p: count_tokens(t, encoding_name="cl100k_base") for p, t in payload.items()
+    }
+    # Distinct lone surrogates keep distinct cache keys.
+    assert tokens._digest("a\ud800") != tokens._digest("a\ud801")
+
+
+def test_cache_hit_skips_encoding_and_refreshes_lru_position(
+    monkeypatch: pytest.MonkeyPatch, encoded: list[str]
+) -> None:
+    monkeypatch.setattr(tokens, "_MAX_COUNT_CACHE_ENTRIES", 2)
+    for text in ["first\n", "second\n", "first\n", "third\n"]:
+        count_content_tokens_by_path({"f.txt": text}, encoding_name="cl100k_base")
+
+    # The repeated "first" was a hit, which made "second" the oldest entry when "third" evicted one.
+    assert encoded == ["first\n", "second\n", "third\n"]
+    assert list(tokens._count_cache) == [("cl100k_base", tokens._digest(t)) for t in ["first\n", "third\n"]]
+
+    count_content_tokens_by_path({"f.txt": "second\n"}, encoding_name="cl100k_base")
+    assert encoded[-1] == "second\n"
+
+
+def test_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tokens, "_MAX_COUNT_CACHE_ENTRIES", 3)
+    payload = {f"f{i}.txt": f"text number {i}\n" for i in range(10)}
+
+    count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+
+    assert len(tokens._count_cache) == 3
+
+
+def test_clear_token_cache_forces_recount(encoded: list[str]) -> None:
+    payload = {"f.txt": "some text\n"}
+    count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+    assert tokens._count_cache
+
+    clear_token_cache()
+    assert not tokens._count_cache
+    count_content_tokens_by_path(payload, encoding_name="cl100k_base")
+    assert encoded == ["some text\n", "some text\n"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 import yaml
@@ -17,112 +17,189 @@ from anatomize.core.types import (
 )
 from anatomize.formats.yaml_fmt import YamlFormatter
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     pass
 
 pytestmark = pytest.mark.unit
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def formatter() -> YamlFormatter:
-    """Create a YAML formatter instance."""
+    """Create a YAML formatter instance (stateless, shared by the module)."""
     return YamlFormatter()
 
 
+@pytest.fixture(scope="module")
+def minimal_dump(formatter: YamlFormatter, minimal_skeleton: Skeleton) -> tuple[str, dict[str, Any]]:
+    """Format `minimal_skeleton` once and return the YAML text with its parsed document."""
+    result = formatter.format_string(minimal_skeleton)
+    return result, yaml.load(result, Loader=_YamlLoader)
+
+
+@pytest.fixture(scope="module")
+def unicode_skeleton() -> Skeleton:
+    """Create a skeleton whose module docstring has non-ASCII text."""
+    return Skeleton(
+        metadata=SkeletonMetadata(
+            generator_version="0.2.0",
+            sources=["/test"],
+            resolution=ResolutionLevel.MODULES,
+        ),
+        packages={"pkg": PackageInfo(name="pkg", subpackages=[], modules=["mod"])},
+        modules={
+            "pkg.mod": ModuleInfo(
+                path="pkg/mod.py",
+                name="pkg.mod",
+                source=0,
+                doc="Unicode: \u00e9\u00e8\u00ea \u4e2d\u6587",
+            )
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_skeleton() -> Skeleton:
+    """Create a skeleton with no packages or modules."""
+    return Skeleton(
+        metadata=SkeletonMetadata(
+            generator_version="0.2.0",
+            sources=["/test"],
+            resolution=ResolutionLevel.HIERARCHY,
+        ),
+        packages={},
+        modules={},
+    )
+
+
+@pytest.fixture(scope="module")
+def multi_pkg_skeleton() -> Skeleton:
+    """Create a skeleton with two top-level packages."""
+    return Skeleton(
+        metadata=SkeletonMetadata(
+            generator_version="0.2.0",
+            sources=["/test"],
+            resolution=ResolutionLevel.HIERARCHY,
+        ),
+        packages={
+            "pkg_a": PackageInfo(name="pkg_a", subpackages=[], modules=["mod1"]),
+            "pkg_b": PackageInfo(name="pkg_b", subpackages=["sub"], modules=["mod2"]),
+        },
+        modules={},
+    )
+
+
+@pytest.fixture(scope="module")
+def special_paths_skeleton() -> Skeleton:
+    """Create a skeleton with spaces and dashes in its paths."""
+    return Skeleton(
+        metadata=SkeletonMetadata(
+            generator_version="0.2.0",
+            sources=["/test/path with spaces"],
+            resolution=ResolutionLevel.MODULES,
+        ),
+        packages={"pkg": PackageInfo(name="pkg", subpackages=[], modules=["mod"])},
+        modules={
+            "pkg.mod": ModuleInfo(
+                path="pkg/file-with-dash.py",
+                name="pkg.mod",
+                source=0,
+            )
+        },
+    )
+
+
+@pytest.fixture(scope="class")
+def written(
+    formatter: YamlFormatter, minimal_skeleton: Skeleton, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, dict[str, Any]]:
+    """Write `minimal_skeleton` once per class and return the output directory with the parsed hierarchy."""
+    out = tmp_path_factory.mktemp("hierarchy")
+    formatter.write(minimal_skeleton, out)
+    return out, yaml.load((out / "hierarchy.yaml").read_text(), Loader=_YamlLoader)
+
+
+@pytest.fixture(scope="class")
+def written_with_classes(
+    formatter: YamlFormatter, skeleton_with_classes: Skeleton, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Write `skeleton_with_classes` once per class and return the output directory."""
+    out = tmp_path_factory.mktemp("modules")
+    formatter.write(skeleton_with_classes, out)
+    return out
+
+
 class TestYamlFormatterWrite:
     """Tests for YamlFormatter.write method."""
 
-    def test_write_creates_hierarchy_file(
-        self, formatter: YamlFormatter, tmp_path: Path, minimal_skeleton: Skeleton
-    ) -> None:
+    def test_write_creates_hierarchy_file(self, written: tuple[Path, dict[str, Any]]) -> None:
         """Test that write creates hierarchy.yaml file."""
-        formatter.write(minimal_skeleton, tmp_path)
-        assert (tmp_path / "hierarchy.yaml").exists()
+        out, _ = written
+        assert (out / "hierarchy.yaml").exists()
 
-    def test_write_creates_modules_directory(
-        self, formatter: YamlFormatter, tmp_path: Path, skeleton_with_classes: Skeleton
-    ) -> None:
+    def test_write_creates_modules_directory(self, written_with_classes: Path) -> None:
         """Test that write creates modules directory when modules exist."""
-        formatter.write(skeleton_with_classes, tmp_path)
-        assert (tmp_path / "modules").exists()
-        assert (tmp_path / "modules").is_dir()
+        assert (written_with_classes / "modules").exists()
+        assert (written_with_classes / "modules").is_dir()
 
-    def test_write_creates_module_files(
-        self, formatter: YamlFormatter, tmp_path: Path, skeleton_with_classes: Skeleton
-    ) -> None:
+    def test_write_creates_module_files(self, written_with_classes: Path) -> None:
         """Test that write creates package-named module files."""
-        formatter.write(skeleton_with_classes, tmp_path)
-        assert (tmp_path / "modules" / "pkg.yaml").exists()
+        assert (written_with_classes / "modules" / "pkg.yaml").exists()
 
-    def test_hierarchy_is_valid_yaml(
-        self, formatter: YamlFormatter, tmp_path: Path, minimal_skeleton: Skeleton
-    ) -> None:
+    def test_hierarchy_is_valid_yaml(self, written: tuple[Path, dict[str, Any]]) -> None:
         """Test that hierarchy file contains valid YAML."""
-        formatter.write(minimal_skeleton, tmp_path)
-        content = (tmp_path / "hierarchy.yaml").read_text()
-        data = yaml.safe_load(content)
+        _, data = written
         assert data is not None
         assert "metadata" in data
 
-    def test_hierarchy_contains_metadata(
-        self, formatter: YamlFormatter, tmp_path: Path, minimal_skeleton: Skeleton
-    ) -> None:
+    def test_hierarchy_contains_metadata(self, written: tuple[Path, dict[str, Any]]) -> None:
         """Test that hierarchy file contains metadata section."""
-        formatter.write(minimal_skeleton, tmp_path)
-        content = (tmp_path / "hierarchy.yaml").read_text()
-        data = yaml.safe_load(content)
+        _, data = written
         assert "generator_version" in data["metadata"]
         assert "resolution" in data["metadata"]
 
-    def test_hierarchy_contains_packages(
-        self, formatter: YamlFormatter, tmp_path: Path, minimal_skeleton: Skeleton
-    ) -> None:
+    def test_hierarchy_contains_packages(self, written: tuple[Path, dict[str, Any]]) -> None:
         """Test that hierarchy file contains packages section."""
-        formatter.write(minimal_skeleton, tmp_path)
-        content = (tmp_path / "hierarchy.yaml").read_text()
-        data = yaml.safe_load(content)
+        _, data = written
         assert "packages" in data
         assert "pkg" in data["packages"]
 
-    def test_module_file_is_valid_yaml(
-        self, formatter: YamlFormatter, tmp_path: Path, skeleton_with_classes: Skeleton
-    ) -> None:
+    def test_module_file_is_valid_yaml(self, written_with_classes: Path) -> None:
         """Test that module files contain valid YAML."""
-        formatter.write(skeleton_with_classes, tmp_path)
-        content = (tmp_path / "modules" / "pkg.yaml").read_text()
-        data = yaml.safe_load(content)
+        content = (written_with_classes / "modules" / "pkg.yaml").read_text()
+        data = yaml.load(content, Loader=_YamlLoader)
         assert data is not None
 
 
 class TestYamlFormatterFormatString:
     """Tests for YamlFormatter.format_string method."""
 
-    def test_format_string_returns_valid_yaml(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_format_string_returns_valid_yaml(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that format_string returns valid YAML."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         assert data is not None
 
-    def test_format_string_includes_metadata(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_format_string_includes_metadata(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that format_string includes metadata."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         assert "metadata" in data
 
-    def test_format_string_includes_packages(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_format_string_includes_packages(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that format_string includes packages."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         assert "packages" in data
 
 
 class TestYamlContent:
     """Tests for YAML content structure."""
 
-    def test_metadata_has_correct_fields(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_metadata_has_correct_fields(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that metadata contains all required fields."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         meta = data["metadata"]
         assert "generator_version" in meta
         assert "sources" in meta
@@ -130,108 +207,54 @@ class TestYamlContent:
         assert "total_packages" in meta
         assert "total_modules" in meta
 
-    def test_packages_structure(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_packages_structure(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that packages have correct structure."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         pkg = data["packages"]["pkg"]
         assert "subpackages" in pkg
         assert "modules" in pkg
 
-    def test_resolution_is_string(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_resolution_is_string(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that resolution level is serialized as string."""
-        result = formatter.format_string(minimal_skeleton)
-        data = yaml.safe_load(result)
+        _, data = minimal_dump
         assert data["metadata"]["resolution"] == "modules"
 
 
 class TestYamlFormatting:
     """Tests for YAML formatting options."""
 
-    def test_output_is_human_readable(self, formatter: YamlFormatter, minimal_skeleton: Skeleton) -> None:
+    def test_output_is_human_readable(self, minimal_dump: tuple[str, dict[str, Any]]) -> None:
         """Test that output is formatted for human readability."""
-        result = formatter.format_string(minimal_skeleton)
+        result, _ = minimal_dump
         # Should use block style, not flow style
         assert "{" not in result or result.count("{") < 3
 
-    def test_unicode_is_preserved(self, formatter: YamlFormatter) -> None:
+    def test_unicode_is_preserved(self, formatter: YamlFormatter, unicode_skeleton: Skeleton) -> None:
         """Test that unicode characters are preserved."""
-        skeleton = Skeleton(
-            metadata=SkeletonMetadata(
-                generator_version="0.2.0",
-                sources=["/test"],
-                resolution=ResolutionLevel.MODULES,
-            ),
-            packages={"pkg": PackageInfo(name="pkg", subpackages=[], modules=["mod"])},
-            modules={
-                "pkg.mod": ModuleInfo(
-                    path="pkg/mod.py",
-                    name="pkg.mod",
-                    source=0,
-                    doc="Unicode: \u00e9\u00e8\u00ea \u4e2d\u6587",
-                )
-            },
-        )
-        result = formatter.format_string(skeleton)
+        result = formatter.format_string(unicode_skeleton)
         # Unicode should be preserved in output
-        data = yaml.safe_load(result)
+        data = yaml.load(result, Loader=_YamlLoader)
         assert data is not None
 
 
 class TestEdgeCases:
     """Tests for edge cases in YAML formatting."""
 
-    def test_empty_skeleton(self, formatter: YamlFormatter) -> None:
+    def test_empty_skeleton(self, formatter: YamlFormatter, empty_skeleton: Skeleton) -> None:
         """Test formatting skeleton with no packages or modules."""
-        skeleton = Skeleton(
-            metadata=SkeletonMetadata(
-                generator_version="0.2.0",
-                sources=["/test"],
-                resolution=ResolutionLevel.HIERARCHY,
-            ),
-            packages={},
-            modules={},
-        )
-        result = formatter.format_string(skeleton)
-        data = yaml.safe_load(result)
+        result = formatter.format_string(empty_skeleton)
+        data = yaml.load(result, Loader=_YamlLoader)
         assert data["packages"] == {}
 
-    def test_multiple_packages(self, formatter: YamlFormatter) -> None:
+    def test_multiple_packages(self, formatter: YamlFormatter, multi_pkg_skeleton: Skeleton) -> None:
         """Test formatting skeleton with multiple packages."""
-        skeleton = Skeleton(
-            metadata=SkeletonMetadata(
-                generator_version="0.2.0",
-                sources=["/test"],
-                resolution=ResolutionLevel.HIERARCHY,
-            ),
-            packages={
-                "pkg_a": PackageInfo(name="pkg_a", subpackages=[], modules=["mod1"]),
-                "pkg_b": PackageInfo(name="pkg_b", subpackages=["sub"], modules=["mod2"]),
-            },
-            modules={},
-        )
-        result = formatter.format_string(skeleton)
-        data = yaml.safe_load(result)
+        result = formatter.format_string(multi_pkg_skeleton)
+        data = yaml.load(result, Loader=_YamlLoader)
         assert "pkg_a" in data["packages"]
         assert "pkg_b" in data["packages"]
 
-    def test_special_characters_in_paths(self, formatter: YamlFormatter) -> None:
+    def test_special_characters_in_paths(self, formatter: YamlFormatter, special_paths_skeleton: Skeleton) -> None:
         """Test that special characters in paths are handled."""
-        skeleton = Skeleton(
-            metadata=SkeletonMetadata(
-                generator_version="0.2.0",
-                sources=["/test/path with spaces"],
-                resolution=ResolutionLevel.MODULES,
-            ),
-            packages={"pkg": PackageInfo(name="pkg", subpackages=[], modules=["mod"])},
-            modules={
-                "pkg.mod": ModuleInfo(
-                    path="pkg/file-with-dash.py",
-                    name="pkg.mod",
-                    source=0,
-                )
-            },
-        )
-        result = formatter.format_string(skeleton)
-        data = yaml.safe_load(result)
+        result = formatter.format_string(special_paths_skeleton)
+        data = yaml.load(result, Loader=_YamlLoader)
         assert data is not None